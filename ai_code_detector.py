@@ -12,12 +12,19 @@ Now with sophisticated detection for AI-generated code characteristics
 import os
 import re
 import sys
+import copy
+import stat
 import json
+import shutil
+import hashlib
 import argparse
+import operator
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-from collections import Counter
-from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple, Union
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, asdict, field, fields, replace
 
 # Import report generator
 from report_generator import ReportGenerator
@@ -36,26 +43,341 @@ class DetectionResult:
     detected_patterns: Dict[str, List[str]] = field(default_factory=dict)
 
 
+class AnalysisError(Exception):
+    """Analysis of a single file raised; stands in for its result in batch runs."""
+
+    def __init__(self, file_path: str, message: str):
+        super().__init__(file_path, message)
+        self.file_path = file_path
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+def _whole_words(*words: str) -> str:
+    """Regex matching any of ``words`` as a whole word, like ``\\b(?:a|b)\\b``.
+
+    The boundary is checked by a lookbehind after each word rather than a
+    leading ``\\b``, so every branch opens with a literal and re can use its
+    fast prefix search to skip ahead.
+    """
+    return '(?:' + '|'.join(f'{w}(?<!\\w{w})' for w in words) + r')(?!\w)'
+
+
+def _variance(values: List[float]) -> float:
+    """Population variance of a non-empty list, taking the mean once."""
+    mean = sum(values) / len(values)
+    return sum((v - mean) ** 2 for v in values) / len(values)
+
+
+def _count_string_concats(code: str) -> int:
+    """Count ``word += 'literal'`` statements, like counting ``\\w+\\s*\\+=\\s*["']``.
+
+    A pattern opening with ``\\w+`` is tried at every word in the file; scanning
+    for the ``+=`` literal and checking for a word behind it by hand finds
+    the same statements. ``str.isspace`` and ``str.isalnum`` agree with re's
+    ``\\s`` and ``\\w``.
+    """
+    count = 0
+    for match in _RE_STRING_APPEND.finditer(code):
+        end = match.start()
+        while end and code[end - 1].isspace():
+            end -= 1
+        if end and (code[end - 1].isalnum() or code[end - 1] == '_'):
+            count += 1
+    return count
+
+
+def _count_self_increments(code: str) -> int:
+    """Count ``name = name + 1`` statements, like ``re.findall(r'(\\w+)\\s*=\\s*\\1\\s*\\+\\s*1', code)``.
+
+    That pattern opens with a ``\\w+`` group, so re tries it at every word
+    character in the file. Scanning from the ``=`` literal for the right-hand
+    word and comparing the word before the ``=`` by hand finds the same
+    matches: the group is always the whole right-hand word, and re's
+    leftmost match takes it as a suffix of the left-hand one.
+    """
+    count = 0
+    last_end = 0
+    for match in _RE_INCREMENT_RHS.finditer(code):
+        name = match.group(1)
+        end = match.start()
+        while end and code[end - 1].isspace():
+            end -= 1
+        start = end - len(name)
+        # re resumes after the previous match, so a left-hand word
+        # reaching back into it cannot match
+        if start >= last_end and code.startswith(name, start):
+            count += 1
+            last_end = match.end()
+    return count
+
+
+def _int_variance(values: List[int]) -> float:
+    """Population variance of a non-empty list of ints from exact integer sums.
+
+    The result is the correctly rounded variance, which the earlier two-pass
+    float formula only approximated. Reported values derived from it, such as
+    formatting_perfection's blank_line_regularity, can therefore differ from
+    older output in their last rounded decimal (0.285 -> 0.286).
+    """
+    n = len(values)
+    total = sum(values)
+    return (n * sum(map(operator.mul, values, values)) - total * total) / (n * n)
+
+
+# Fixed patterns used by the formatting, consistency and contextual-quirk analyzers
+# snake_case or camelCase words; the group captures '_' only for snake_case.
+# Both kinds differ in the character after the lowercase run, so one scan
+# yields the same counts as two. Such words are whole identifiers, so the
+# pattern runs over CodeView.identifiers joined one per line.
+_RE_SNAKE_OR_CAMEL = re.compile(r'^[a-z]+(?:(_)[a-z]+|[A-Z][a-z]+)$', re.MULTILINE)
+_RE_SPACED_OP = re.compile(r'\s[=+\-*/]\s')
+_RE_UNSPACED_OP = re.compile(r'[a-zA-Z0-9][=+\-*/][a-zA-Z0-9]')
+_RE_TODO = re.compile(r'(#|//)\s*(TODO|FIXME|HACK|NOTE|XXX)', re.IGNORECASE)
+_RE_TEMP_VARS = re.compile(_whole_words('tmp', 'temp', 'foo', 'bar', 'baz', 'xxx', 'yyy', 'zzz'))
+_DEBUG_LITERALS = ('console.log', 'debugger', 'System.out.print')
+_RE_PRINT_CALL = re.compile(r'print\s*\(')
+_RE_COMMENTED_PY = re.compile(r'#\s*(?:if|for|while|def|class|return|import)\s')
+_RE_COMMENTED_JS = re.compile(r'//\s*(?:if|for|while|function|class|return|import)\s')
+_RE_MAGIC = re.compile(r'\d+\s*#')
+_ABBREVIATIONS = ('cfg', 'ctx', 'env', 'msg', 'req', 'res', 'db', 'api', 'btn', 'img', 'err', 'fmt')
+_RE_ABBREV = re.compile(_whole_words(*_ABBREVIATIONS))
+
+# Short variable names counted as human-style abbreviations by the naming analyzer
+_ABBREVIATED_VAR_NAMES = ('i', 'j', 'k', 'x', 'y', 'z', 'tmp', 'temp', 'val', 'res',
+                          'arr', 'obj', 'fn', 'cb', 'idx', 'cnt', 'num', 'str')
+
+# Patterns used by the remaining analyzers, compiled once at import
+_RE_IDENTIFIER = re.compile(r'[a-zA-Z_](?<!\w[a-zA-Z_])[a-zA-Z0-9_]*(?!\w)')
+_RE_CONTROL_KEYWORD = re.compile(_whole_words('if', 'for', 'while', 'switch', 'case'))
+_RE_TRY_BLOCK = re.compile(r'try(?<!\wtry)\s*:')
+_RE_EXCEPT_CLAUSE = re.compile(r'except(?<!\wexcept)\s+')
+# Case-insensitive 'if x is not None' / 'if x != null'. A global IGNORECASE flag
+# hides the 'if' prefix from re's scanner, so the prefix is spelled out as
+# every character IGNORECASE equates with 'i' and 'f', and only the tail
+# is case-insensitive.
+_RE_ANY_NULL_CHECK = re.compile(r'[iI\u0130\u0131][fF]\s+\w+(?i:\s+is\s+not\s+None|\s*!=\s*null)')
+_RE_DOCSTRING = re.compile(r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'')
+_RE_FUNCTION_DEF = re.compile(r'def(?<!\wdef)\s+\w+\s*\(')
+_RE_CLASS_DEF = re.compile(r'class(?<!\wclass)\s+\w+')
+_RE_BASIC_TYPE_HINT = re.compile(r':\s*(str|int|float|bool|List|Dict)')
+_RE_F_PREFIX = re.compile(r'f(?<!\wf)-["\']')
+_RE_AWAIT = re.compile(r'await(?<!\wawait)\s+')
+_RE_ASYNC_DEF = re.compile(r'async(?<!\wasync)\s+def')
+_RE_WITH = re.compile(r'with(?<!\wwith)\s+\w+')
+_RE_VAR_DECL = re.compile(r'var(?<!\wvar)\s+')
+_RE_PERCENT_FORMAT = re.compile(r'%\s*[sd]')
+_RE_NONE_CHECK = re.compile(r'if\s+\w+\s+is\s+not\s+None')
+_RE_NULL_ANCHOR = re.compile(r'!=\s*(?i:null)')
+_RE_NULL_CHECK = re.compile(r'if\s+\w+\s*!=\s*null', re.IGNORECASE)
+_RE_ISINSTANCE = re.compile(r'isinstance\s*\(\s*\w+\s*,\s*\w+\s*\)')
+_RE_ASSERT = re.compile(r'assert\s+.+')
+_RE_IF_CONDITION = re.compile(r'if\s+(.+?):')
+_RE_VALIDATION = re.compile(r'if\s+(?:not\s+\w+|\w+\s+is\s+None)\s*:')
+_RE_RAISE_VALIDATION = re.compile(r'raise\s+(ValueError|TypeError|RuntimeError)')
+_RE_RANGE_LEN = re.compile(r'range\s*\(\s*len\s*\(')
+_RE_STRING_APPEND = re.compile(r'\+=\s*["\']')
+_RE_INCREMENT_RHS = re.compile(r'=\s*(\w+)\s*\+\s*1')
+_RE_APPEND_IN_LOOP = re.compile(r'for\s+.+:\s*\n\s+\w+\.append\(', re.MULTILINE)
+_RE_FUNCTION_NAME = re.compile(r'def\s+(\w+)\s*\(')
+# Any of the helper-style name fragments, searched in lowercased function names
+_RE_HELPER_NAME = re.compile('_(?:helper|util|process|handle|validate|check|get|set|create)')
+
+
+class CodeView:
+    """Line-level views of a source file, split once and shared by every analyzer."""
+
+    def __init__(self, code: str):
+        self.code = code
+        self.lines = code.split('\n')
+        self.stripped = [l.strip() for l in self.lines]
+        self.nonblank = [l for l, s in zip(self.lines, self.stripped) if s]
+        # Derived views, built on first use
+        self._indents: Optional[List[int]] = None
+        self._indent_buckets: Optional[List[int]] = None
+        self._comment_indices: Optional[List[int]] = None
+        self._blank_indices: Optional[List[int]] = None
+        self._code_line_count: Optional[int] = None
+        self._spaced_operator_count: Optional[int] = None
+        self._identifiers: Optional[List[str]] = None
+        self._try_block_count: Optional[int] = None
+
+    @property
+    def indents(self) -> List[int]:
+        """Leading-whitespace widths of the indented non-blank lines."""
+        if self._indents is None:
+            self._indents = [w for w in (len(l) - len(l.lstrip()) for l in self.nonblank) if w]
+        return self._indents
+
+    @property
+    def indent_buckets(self) -> List[int]:
+        """Counts of indented lines by indent width mod 4."""
+        if self._indent_buckets is None:
+            # Widths mod 4 packed into bytes, so each bucket is one C-level count
+            residues = bytes(map((3).__and__, self.indents))
+            self._indent_buckets = [residues.count(r) for r in range(4)]
+        return self._indent_buckets
+
+    @property
+    def comment_indices(self) -> List[int]:
+        """Indices of lines that start with a '#' or '//' comment."""
+        if self._comment_indices is None:
+            self._comment_indices = [i for i, s in enumerate(self.stripped) if s.startswith(('#', '//'))]
+        return self._comment_indices
+
+    @property
+    def blank_indices(self) -> List[int]:
+        """Indices of blank lines."""
+        if self._blank_indices is None:
+            self._blank_indices = [i for i, s in enumerate(self.stripped) if not s]
+        return self._blank_indices
+
+    @property
+    def code_line_count(self) -> int:
+        """Number of non-blank lines that are not '#' comments."""
+        if self._code_line_count is None:
+            self._code_line_count = sum(1 for s in self.stripped if s and not s.startswith('#'))
+        return self._code_line_count
+
+    @property
+    def identifiers(self) -> List[str]:
+        """ASCII identifiers in order of appearance."""
+        if self._identifiers is None:
+            # Same matches as \b[a-zA-Z_][a-zA-Z0-9_]*\b, but opening with the
+            # character class lets re skip ahead to candidate starts
+            self._identifiers = _RE_IDENTIFIER.findall(self.code)
+        return self._identifiers
+
+    @property
+    def spaced_operator_count(self) -> int:
+        """Number of operators with whitespace on both sides."""
+        if self._spaced_operator_count is None:
+            self._spaced_operator_count = len(_RE_SPACED_OP.findall(self.code))
+        return self._spaced_operator_count
+
+    @property
+    def try_block_count(self) -> int:
+        """Number of 'try:' blocks."""
+        if self._try_block_count is None:
+            self._try_block_count = len(_RE_TRY_BLOCK.findall(self.code))
+        return self._try_block_count
+
+
 class AICodeDetector:
     """Detector class for identifying AI-generated code patterns."""
 
-    def __init__(self, max_file_size: int = 1024 * 1024):
+    # Number of analysis results kept, keyed by a hash of the file content
+    RESULT_CACHE_SIZE = 4096
+
+    # Number of results kept in the on-disk cache; the oldest are evicted first
+    DISK_CACHE_SIZE = 20000
+
+    # Weight of each dimension in the overall AI score
+    DIMENSION_WEIGHTS = {
+        # Original dimensions (weight: 1.0)
+        'naming_analysis': 1.0,
+        'comment_analysis': 1.0,
+        'structure_analysis': 1.0,
+        'complexity_analysis': 1.0,
+        'error_handling': 1.0,
+        'documentation': 1.0,
+        'formatting_consistency': 1.0,
+        'modern_syntax': 1.0,
+        # New dimensions (weight: 1.2 for higher impact)
+        'enhanced_comment_analysis': 1.2,
+        'defensive_coding': 1.2,
+        'textbook_algorithms': 1.0,
+        'over_modularization': 1.0,
+        'perfect_consistency': 1.2,
+        'contextual_quirks': 1.2,
+        'formatting_perfection': 1.2,
+        'obvious_comments': 1.3,
+    }
+
+    # Order used by fast analysis: most weight per unit of work first, so the
+    # score usually settles before the costliest regex scans are reached
+    FAST_DIMENSION_ORDER = [
+        'obvious_comments', 'contextual_quirks', 'formatting_perfection', 'enhanced_comment_analysis',
+        'modern_syntax', 'structure_analysis', 'documentation', 'formatting_consistency',
+        'over_modularization', 'complexity_analysis', 'defensive_coding', 'error_handling',
+        'comment_analysis', 'perfect_consistency', 'naming_analysis', 'textbook_algorithms',
+    ]
+
+    # AI score cut points used by _determine_verdict
+    VERDICT_SCORE_THRESHOLDS = [0.30, 0.35, 0.45, 0.55, 0.70]
+    # Verdict for each band: at or below the first threshold, then above each one
+    VERDICTS = (
+        "LIKELY HUMAN-WRITTEN", "MIXED INDICATORS", "MIXED INDICATORS",
+        "POSSIBLY AI-ASSISTED", "LIKELY AI-GENERATED", "HIGHLY LIKELY AI-GENERATED",
+    )
+    # Dimensions scoring above 0.4 count as strong AI indicators in the verdict
+    STRONG_INDICATOR_DIMENSIONS = (
+        'obvious_comments', 'enhanced_comment_analysis', 'perfect_consistency',
+        'contextual_quirks', 'formatting_perfection', 'defensive_coding',
+    )
+
+    # Key indicators: (dimension, score, comparison, threshold, indicator name)
+    INDICATOR_RULES = (
+        ('naming_analysis', 'avg_identifier_length', operator.gt, 10, 'verbose_naming'),
+        ('comment_analysis', 'comment_ratio', operator.gt, 0.25, 'high_documentation'),
+        ('structure_analysis', 'indent_consistency', operator.gt, 0.9, 'perfect_formatting'),
+        ('error_handling', 'error_handling_ratio', operator.gt, 0.08, 'comprehensive_error_handling'),
+        ('modern_syntax', 'modern_ratio', operator.gt, 0.8, 'modern_syntax_heavy'),
+        ('enhanced_comment_analysis', 'ai_phrase_ratio', operator.gt, 0.2, 'ai_typical_comment_phrases'),
+        ('enhanced_comment_analysis', 'obvious_ratio', operator.gt, 0.15, 'obvious_comments_detected'),
+        ('defensive_coding', 'defensive_ratio', operator.gt, 0.1, 'excessive_defensive_coding'),
+        ('textbook_algorithms', 'textbook_pattern_count', operator.gt, 2, 'textbook_implementations'),
+        ('over_modularization', 'small_function_ratio', operator.gt, 0.4, 'over_modularized'),
+        ('perfect_consistency', 'perfect_consistency_count', operator.ge, 2, 'unnaturally_perfect_consistency'),
+        ('contextual_quirks', 'missing_quirk_count', operator.ge, 4, 'lacks_human_quirks'),
+        ('formatting_perfection', 'perfection_count', operator.ge, 3, 'flawless_formatting'),
+        ('obvious_comments', 'obvious_ratio', operator.gt, 0.2, 'explains_obvious_code'),
+    )
+
+    # Subdirectory of cache_dir owned by the detector, and the file marking each
+    # per-source namespace inside it as safe to remove once stale
+    DISK_CACHE_SUBDIR = 'results-v1'
+    DISK_CACHE_MARKER = '.ai_code_detector'
+
+    def __init__(self, max_file_size: int = 1024 * 1024, cache_dir: Optional[str] = None,
+                 prune_cache: bool = True):
         self.max_file_size = max_file_size
+        self._result_cache: 'OrderedDict[bytes, DetectionResult]' = OrderedDict()
+        # Content digests of files already read, keyed by (path, mtime_ns, size)
+        self._stat_cache: 'OrderedDict[Tuple[str, int, int], bytes]' = OrderedDict()
+        # Optional on-disk result cache shared across runs. Entries live under a
+        # hash of this module's source, so any change to the analysis starts a
+        # fresh cache and the namespaces of older sources are removed (unless
+        # prune_cache is off, as in worker processes).
+        self.cache_dir = cache_dir
+        self._disk_cache: Optional[Path] = None
+        if cache_dir:
+            source_hash = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+            self._disk_cache = Path(cache_dir) / self.DISK_CACHE_SUBDIR / source_hash
+            if prune_cache:
+                self._prune_disk_cache()
         self.ai_patterns = {
-            'verbose_naming': r'[a-z]+[A-Z][a-z]+[A-Z][a-z]+',
-            'descriptive_vars': r'(user_data|response_data|result_data|input_value|output_value)',
-            'formal_comments': r'("""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\')',
-            'type_hints': r':\s*(str|int|float|bool|List|Dict|Tuple|Optional|Union)',
+            # The lookbehind stops the engine restarting inside a lowercase run;
+            # every match begins at a run start, so the match set is unchanged.
+            # Placing it after the first [a-z] keeps that class as the prefix re
+            # scans for.
+            'verbose_naming': re.compile(r'[a-z](?<![a-z][a-z])[a-z]*[A-Z][a-z]+[A-Z][a-z]+'),
+            'descriptive_vars': re.compile(r'(?:user_data|response_data|result_data|input_value|output_value)'),
+            'formal_comments': re.compile(r'("""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\')'),
+            'type_hints': re.compile(r':\s*(str|int|float|bool|List|Dict|Tuple|Optional|Union)'),
         }
 
+        self._abbreviated_names = frozenset(_ABBREVIATED_VAR_NAMES)
         self.human_patterns = {
-            'abbreviated_vars': r'\b(i|j|k|x|y|z|tmp|temp|val|res|arr|obj|fn|cb|idx|cnt|num|str)\b',
-            'legacy_syntax': r'(var\s+|function\s*\(|\.prototype\.|document\.write)',
-            'informal_comments': r'(#\s*TODO|#\s*FIXME|#\s*HACK|#\s*NOTE|#\s*XXX|//\s*TODO|//\s*FIXME|//\s*HACK|//\s*NOTE|//\s*XXX)',
+            'abbreviated_vars': re.compile(_whole_words(*_ABBREVIATED_VAR_NAMES)),
+            'legacy_syntax': re.compile(r'(var\s+|function\s*\(|\.prototype\.|document\.write)'),
+            'informal_comments': re.compile(r'(#\s*TODO|#\s*FIXME|#\s*HACK|#\s*NOTE|#\s*XXX|//\s*TODO|//\s*FIXME|//\s*HACK|//\s*NOTE|//\s*XXX)'),
         }
 
         # AI-typical comment phrases (over-explanation patterns)
-        self.ai_comment_phrases = [
+        self.ai_comment_phrases = [re.compile(phrase) for phrase in [
             r'check\s+that',
             r'ensure\s+that',
             r'make\s+sure',
@@ -75,10 +397,10 @@ class AICodeDetector:
             r'should\s+have\s+the\s+expected',
             r'should\s+contain',
             r'test\s+that\s+the',
-        ]
+        ]]
 
         # Obvious comment patterns (explaining what code does, not why)
-        self.obvious_comment_patterns = [
+        self.obvious_comment_patterns = [(re.compile(pattern, re.IGNORECASE), description) for pattern, description in [
             (r'#\s*increment\s+\w+', 'Increment variable'),
             (r'#\s*decrement\s+\w+', 'Decrement variable'),
             (r'#\s*initialize\s+(the\s+)?\w+', 'Initialize variable'),
@@ -106,25 +428,40 @@ class AICodeDetector:
             (r'//\s*return\s+(the\s+)?result', 'Return result'),
             (r'//\s*loop\s+through', 'Loop through'),
             (r'//\s*check\s+if', 'Check if'),
-        ]
+        ]]
 
         # Textbook algorithm patterns
-        self.textbook_patterns = [
+        self.textbook_patterns = [(re.compile(pattern), description) for pattern, description in [
             (r'for\s+\w+\s+in\s+range\s*\(\s*len\s*\(\s*\w+\s*\)\s*\)', 'range(len()) instead of enumerate'),
             (r'for\s+\w+\s+in\s+range\s*\(\s*len\s*\(\s*\w+\s*\)\s*-\s*1\s*\)', 'Bubble sort pattern'),
             (r'if\s+\w+\s*==\s*True', 'Explicit True comparison'),
             (r'if\s+\w+\s*==\s*False', 'Explicit False comparison'),
             (r'if\s+len\s*\(\s*\w+\s*\)\s*==\s*0', 'len() == 0 instead of not'),
             (r'if\s+len\s*\(\s*\w+\s*\)\s*>\s*0', 'len() > 0 instead of truthiness'),
-            (r'(\w+)\s*=\s*\1\s*\+\s*1', 'i = i + 1 instead of i += 1'),
             (r'\[\s*i\s*\]\s*>\s*\[\s*i\s*\+\s*1\s*\]', 'Adjacent element comparison (bubble sort)'),
-        ]
+        ]]
+
+        # Fused alternations, so each comment is scanned once per family rather
+        # than once per pattern. Non-capturing groups keep re's fast paths, and
+        # the obvious-comment prefilter factors out the shared '#'/'//' marker.
+        self._ai_phrase_re = re.compile('|'.join(f'(?:{p.pattern})' for p in self.ai_comment_phrases))
+        obvious_bodies = dict.fromkeys(p.pattern.split('\\s*', 1)[1] for p, _ in self.obvious_comment_patterns)
+        self._obvious_prefilter = re.compile(r'(?:#|//)\s*(?:' + '|'.join(obvious_bodies) + ')', re.IGNORECASE)
+
+    def analyze_file(self, file_path: str, fast: bool = False) -> DetectionResult:  # pylint: disable=too-many-return-statements
+        """Analyze a single file for AI code patterns.
 
-    def analyze_file(self, file_path: str) -> DetectionResult:
-        """Analyze a single file for AI code patterns."""
+        ``fast`` skips dimensions that can no longer change the score band;
+        see _analyze_code.
+        """
         try:
-            # Check if file exists and is a regular file
-            if not os.path.isfile(file_path):
+            # Check if file exists and is a regular file; one stat call also
+            # provides the size checked below
+            try:
+                file_stat = os.stat(file_path)
+            except (OSError, ValueError):
+                file_stat = None
+            if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
                 return DetectionResult(
                     file_path=file_path,
                     ai_probability=0.0,
@@ -137,7 +474,7 @@ class AICodeDetector:
                 )
 
             # Check file size before reading
-            if os.path.getsize(file_path) > self.max_file_size:
+            if file_stat.st_size > self.max_file_size:
                 return DetectionResult(
                     file_path=file_path,
                     ai_probability=0.0,
@@ -149,8 +486,16 @@ class AICodeDetector:
                     detected_patterns={}
                 )
 
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                code = f.read()
+            # An unchanged file maps to a digest whose result is still cached
+            stat_key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+            cached = self._result_cache.get(self._stat_cache.get(stat_key))
+            if cached is not None:
+                return replace(copy.deepcopy(cached), file_path=file_path)
+
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            # Decode in one call; newline handling matches a text-mode read
+            code = raw.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
         except Exception as e: # pylint: disable=broad-exception-caught
             return DetectionResult(
                 file_path=file_path,
@@ -163,80 +508,214 @@ class AICodeDetector:
                 detected_patterns={}
             )
 
-        detected_patterns = {}
-        scores = {}
-
-        # Original 8 dimensions
-        scores['naming_analysis'] = self._analyze_naming_patterns(code)
-        scores['comment_analysis'] = self._analyze_comment_style(code)
-        scores['structure_analysis'] = self._analyze_code_structure(code)
-        scores['complexity_analysis'] = self._analyze_complexity(code)
-        scores['error_handling'] = self._analyze_error_handling(code)
-        scores['documentation'] = self._analyze_documentation(code)
-        scores['formatting_consistency'] = self._analyze_formatting(code)
-        scores['modern_syntax'] = self._analyze_syntax_modernity(code)
-
-        # New enhanced dimensions
-        comment_result = self._analyze_enhanced_comments(code)
-        scores['enhanced_comment_analysis'] = comment_result['scores']
-        detected_patterns['obvious_comments'] = comment_result['obvious_comments']
-        detected_patterns['ai_phrases'] = comment_result['ai_phrases']
-
-        defensive_result = self._analyze_defensive_coding(code)
-        scores['defensive_coding'] = defensive_result['scores']
-        detected_patterns['defensive_patterns'] = defensive_result['patterns']
+        # Identical content always scores identically, so reuse earlier results
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        cached = self._result_cache.get(digest)
+        if cached is not None:
+            self._result_cache.move_to_end(digest)
+            self._remember_stat(stat_key, digest)
+            return replace(copy.deepcopy(cached), file_path=file_path)
+
+        result = self._load_disk_cache(digest, file_path)
+        if result is None:
+            result = self._analyze_code(file_path, code, fast)
+            if fast:
+                # Partial results must not be served to full analyses
+                return result
+            self._store_disk_cache(digest, result)
+        # Cached results are copied in and out so callers never share their dicts
+        self._result_cache[digest] = copy.deepcopy(result)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        self._remember_stat(stat_key, digest)
+        return result
+
+    def _remember_stat(self, stat_key: Tuple[str, int, int], digest: bytes):
+        """Record which content digest a file had at this mtime and size."""
+        self._stat_cache[stat_key] = digest
+        self._stat_cache.move_to_end(stat_key)
+        if len(self._stat_cache) > self.RESULT_CACHE_SIZE:
+            self._stat_cache.popitem(last=False)
+
+    def _load_disk_cache(self, digest: bytes, file_path: str) -> Optional[DetectionResult]:
+        """Return the on-disk result for this content digest, if there is one."""
+        if self._disk_cache is None:
+            return None
+        try:
+            with open(self._disk_cache / f'{digest.hex()}.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return DetectionResult(**{**data, 'file_path': file_path})
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _prune_disk_cache(self):
+        """Drop stale source namespaces and evict the oldest entries over DISK_CACHE_SIZE."""
+        root, current = self._disk_cache.parent, self._disk_cache.name
+        try:
+            for entry in os.scandir(root):
+                # Only namespaces the detector created and marked are removed
+                if (entry.name != current and entry.is_dir(follow_symlinks=False)
+                        and os.path.isfile(os.path.join(entry.path, self.DISK_CACHE_MARKER))):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            entries = [entry for entry in os.scandir(self._disk_cache) if entry.name.endswith('.json')]
+        except OSError:
+            return
+        excess = len(entries) - self.DISK_CACHE_SIZE
+        if excess <= 0:
+            return
+        try:
+            entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        except OSError:
+            return
+        for entry in entries[:excess]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+    def _store_disk_cache(self, digest: bytes, result: DetectionResult):
+        """Write a result to the on-disk cache; failures only cost a later re-analysis."""
+        if self._disk_cache is None:
+            return
+        target = self._disk_cache / f'{digest.hex()}.json'
+        temp = target.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            if not self._disk_cache.is_dir():
+                self._disk_cache.mkdir(parents=True, exist_ok=True)
+                (self._disk_cache / self.DISK_CACHE_MARKER).touch()
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(asdict(result), f)
+            os.replace(temp, target)
+        except OSError:
+            pass
+
+    def analyze_files(self, file_paths: List[str], workers: Optional[int] = None,
+                      fast: bool = False) -> List[DetectionResult]:
+        """Analyze several files, spreading them across worker processes."""
+        return list(self.iter_analyze_files(file_paths, workers, fast))
+
+    def iter_analyze_files(self, file_paths: List[str], workers: Optional[int] = None,
+                           fast: bool = False,
+                           return_exceptions: bool = False) -> Iterator[Union[DetectionResult, AnalysisError]]:
+        """Yield per-file results in input order as worker processes finish them.
+
+        A file whose analysis raises is reported as an AnalysisError in its slot
+        when return_exceptions is set, so the remaining files are still analyzed;
+        otherwise the error propagates.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(file_paths) < 2:
+            for path in file_paths:
+                result = _analyze_isolated(self, path, fast)
+                if isinstance(result, AnalysisError) and not return_exceptions:
+                    raise result
+                yield result
+            return
+
+        # Each worker compiles its own detector, of this detector's class, once
+        # and then handles whole batches
+        workers = min(workers, len(file_paths))
+        chunksize = max(1, min(16, len(file_paths) // (workers * 4)))
+        batches = [file_paths[i:i + chunksize] for i in range(0, len(file_paths), chunksize)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(type(self), self.max_file_size, self.cache_dir)) as executor:
+            futures = [executor.submit(_analyze_batch_in_worker, batch, fast) for batch in batches]
+            try:
+                for batch, future in zip(batches, futures):
+                    try:
+                        results = future.result()
+                    except Exception as e:  # pylint: disable=broad-exception-caught
+                        # A dead worker (BrokenProcessPool) fails its whole batch
+                        results = [AnalysisError(path, str(e) or type(e).__name__) for path in batch]
+                    for result in results:
+                        if isinstance(result, AnalysisError) and not return_exceptions:
+                            raise result
+                        yield result
+            finally:
+                # On an error or an abandoned iterator, don't let the executor's
+                # shutdown wait for batches nobody will read
+                for future in futures:
+                    future.cancel()
+
+    def _dimension_runners(self, code: str,
+                           view: CodeView) -> Dict[str, Callable[[], Tuple[Dict[str, Any], Dict[str, List[str]]]]]:
+        """Map each dimension to a call returning its scores and detected patterns."""
+        def with_patterns(analyze, **pattern_keys):
+            def run():
+                result = analyze(code, view)
+                return result['scores'], {key: result[source] for key, source in pattern_keys.items()}
+            return run
 
-        textbook_result = self._analyze_textbook_algorithms(code)
-        scores['textbook_algorithms'] = textbook_result['scores']
-        detected_patterns['textbook_patterns'] = textbook_result['patterns']
+        return {
+            'naming_analysis': lambda: (self._analyze_naming_patterns(code, view), {}),
+            'comment_analysis': lambda: (self._analyze_comment_style(code, view), {}),
+            'structure_analysis': lambda: (self._analyze_code_structure(code, view), {}),
+            'complexity_analysis': lambda: (self._analyze_complexity(code, view), {}),
+            'error_handling': lambda: (self._analyze_error_handling(code, view), {}),
+            'documentation': lambda: (self._analyze_documentation(code), {}),
+            'formatting_consistency': lambda: (self._analyze_formatting(code, view), {}),
+            'modern_syntax': lambda: (self._analyze_syntax_modernity(code), {}),
+            'enhanced_comment_analysis': with_patterns(self._analyze_enhanced_comments,
+                                                       obvious_comments='obvious_comments', ai_phrases='ai_phrases'),
+            'defensive_coding': with_patterns(self._analyze_defensive_coding, defensive_patterns='patterns'),
+            'textbook_algorithms': with_patterns(self._analyze_textbook_algorithms, textbook_patterns='patterns'),
+            'over_modularization': with_patterns(self._analyze_over_modularization, small_functions='small_functions'),
+            'perfect_consistency': lambda: (self._analyze_enhanced_consistency(code, view), {}),
+            'contextual_quirks': with_patterns(self._analyze_contextual_quirks, missing_quirks='missing'),
+            'formatting_perfection': lambda: (self._analyze_formatting_perfection(code, view), {}),
+            'obvious_comments': with_patterns(self._analyze_obvious_comments, obvious_comment_examples='examples'),
+        }
 
-        modular_result = self._analyze_over_modularization(code)
-        scores['over_modularization'] = modular_result['scores']
-        detected_patterns['small_functions'] = modular_result['small_functions']
+    def _analyze_code(self, file_path: str, code: str, fast: bool = False) -> DetectionResult:
+        """Run the analysis dimensions over ``code`` and combine the scores.
 
-        consistency_result = self._analyze_enhanced_consistency(code)
-        scores['perfect_consistency'] = consistency_result
+        With ``fast`` set, dimensions run in FAST_DIMENSION_ORDER and stop as
+        soon as the dimensions still to run could no longer change the verdict
+        or the confidence. Dimensions whose score is already known are not run
+        at all. Skipped dimensions count as their known score, or 0.5
+        otherwise, in the weighted score, so ai_probability is an estimate;
+        they are left out of the detailed scores and listed under the
+        ``skipped_dimensions`` indicator.
+        """
+        view = CodeView(code)
+        runners = self._dimension_runners(code, view)
+        total_weight = sum(self.DIMENSION_WEIGHTS.values())
 
-        quirks_result = self._analyze_contextual_quirks(code)
-        scores['contextual_quirks'] = quirks_result['scores']
-        detected_patterns['missing_quirks'] = quirks_result['missing']
+        # Contextual quirks only score code with more than 30 non-blank lines
+        known_scores = {}
+        if fast and len(view.nonblank) <= 30:
+            known_scores['contextual_quirks'] = 0.0
 
-        formatting_result = self._analyze_formatting_perfection(code)
-        scores['formatting_perfection'] = formatting_result
+        scores = {}
+        found_patterns = {}
+        confidence = None
+        for name in (self.FAST_DIMENSION_ORDER if fast else self.DIMENSION_WEIGHTS):
+            if name in known_scores:
+                continue
+            scores[name], found_patterns[name] = runners[name]()
+            if fast:
+                known_scores[name] = scores[name]['ai_indicators']
+                confidence = self._settled_confidence(known_scores)
+                if confidence is not None:
+                    break
 
-        obvious_result = self._analyze_obvious_comments(code)
-        scores['obvious_comments'] = obvious_result['scores']
-        detected_patterns['obvious_comment_examples'] = obvious_result['examples']
+        # Report dimensions and patterns in their usual order
+        scores = {name: scores[name] for name in self.DIMENSION_WEIGHTS if name in scores}
+        detected_patterns = {}
+        for name in scores:
+            detected_patterns.update(found_patterns[name])
 
         # Calculate weighted AI score from all dimensions
-        dimension_scores = [
-            # Original dimensions (weight: 1.0)
-            (scores['naming_analysis']['ai_indicators'], 1.0),
-            (scores['comment_analysis']['ai_indicators'], 1.0),
-            (scores['structure_analysis']['ai_indicators'], 1.0),
-            (scores['complexity_analysis']['ai_indicators'], 1.0),
-            (scores['error_handling']['ai_indicators'], 1.0),
-            (scores['documentation']['ai_indicators'], 1.0),
-            (scores['formatting_consistency']['ai_indicators'], 1.0),
-            (scores['modern_syntax']['ai_indicators'], 1.0),
-            # New dimensions (weight: 1.2 for higher impact)
-            (scores['enhanced_comment_analysis']['ai_indicators'], 1.2),
-            (scores['defensive_coding']['ai_indicators'], 1.2),
-            (scores['textbook_algorithms']['ai_indicators'], 1.0),
-            (scores['over_modularization']['ai_indicators'], 1.0),
-            (scores['perfect_consistency']['ai_indicators'], 1.2),
-            (scores['contextual_quirks']['ai_indicators'], 1.2),
-            (scores['formatting_perfection']['ai_indicators'], 1.2),
-            (scores['obvious_comments']['ai_indicators'], 1.3),
-        ]
-
-        total_weight = sum(w for _, w in dimension_scores)
-        ai_score = sum(s * w for s, w in dimension_scores) / total_weight
+        ai_score = sum(scores[name]['ai_indicators'] * weight if name in scores else known_scores.get(name, 0.5) * weight
+                       for name, weight in self.DIMENSION_WEIGHTS.items()) / total_weight
 
         human_score = 1.0 - ai_score
-        confidence = self._calculate_confidence(scores)
+        if confidence is None:
+            confidence = self._calculate_confidence(scores)
         verdict = self._determine_verdict(ai_score, confidence, scores)
         indicators = self._extract_key_indicators(scores, detected_patterns)
+        if len(scores) < len(self.DIMENSION_WEIGHTS):
+            indicators['skipped_dimensions'] = [name for name in self.DIMENSION_WEIGHTS if name not in scores]
 
         return DetectionResult(
             file_path=file_path,
@@ -249,15 +728,19 @@ class AICodeDetector:
             detected_patterns=detected_patterns
         )
 
-    def _analyze_naming_patterns(self, code: str) -> Dict[str, Any]:
-        lines = [l for l in code.split('\n') if l.strip() and not l.strip().startswith('#')]
+    def _analyze_naming_patterns(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
+        view = view or CodeView(code)
+        code_line_count = view.code_line_count
 
-        verbose_matches = len(re.findall(self.ai_patterns['verbose_naming'], code))
-        descriptive_matches = len(re.findall(self.ai_patterns['descriptive_vars'], code))
-        abbreviated_matches = len(re.findall(self.human_patterns['abbreviated_vars'], code))
+        verbose_matches = len(self.ai_patterns['verbose_naming'].findall(code))
+        descriptive_matches = len(self.ai_patterns['descriptive_vars'].findall(code))
 
-        identifiers = re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', code)
-        avg_identifier_length = sum(len(i) for i in identifiers) / max(len(identifiers), 1)
+        identifiers = view.identifiers
+        avg_identifier_length = sum(map(len, identifiers)) / max(len(identifiers), 1)
+
+        # Identifiers are whole words, so the abbreviated_vars matches are
+        # exactly the identifiers spelled like one of the names
+        abbreviated_matches = sum(map(self._abbreviated_names.__contains__, identifiers))
 
         ai_score = 0.0
         if avg_identifier_length > 12:
@@ -265,11 +748,11 @@ class AICodeDetector:
         elif avg_identifier_length > 8:
             ai_score += 0.2
 
-        if verbose_matches > len(lines) * 0.3:
+        if verbose_matches > code_line_count * 0.3:
             ai_score += 0.3
         if descriptive_matches > 5:
             ai_score += 0.2
-        if abbreviated_matches > len(lines) * 0.2:
+        if abbreviated_matches > code_line_count * 0.2:
             ai_score -= 0.3
 
         ai_score = max(0.0, min(1.0, ai_score))
@@ -282,17 +765,16 @@ class AICodeDetector:
             'descriptive_count': descriptive_matches
         }
 
-    def _analyze_comment_style(self, code: str) -> Dict[str, Any]:
-        lines = code.split('\n')
-        comment_lines = [l for l in lines if l.strip().startswith('#') or l.strip().startswith('//')]
+    def _analyze_comment_style(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
+        view = view or CodeView(code)
+        comment_lines = [view.lines[i] for i in view.comment_indices]
 
-        formal_comments = len(re.findall(self.ai_patterns['formal_comments'], code))
-        informal_comments = len(re.findall(self.human_patterns['informal_comments'], code))
+        formal_comments = len(self.ai_patterns['formal_comments'].findall(code))
+        informal_comments = len(self.human_patterns['informal_comments'].findall(code))
 
-        code_lines = [l for l in lines if l.strip() and not l.strip().startswith('#')]
-        comment_ratio = len(comment_lines) / max(len(code_lines), 1)
+        comment_ratio = len(comment_lines) / max(view.code_line_count, 1)
 
-        avg_comment_length = sum(len(c) for c in comment_lines) / max(len(comment_lines), 1) if comment_lines else 0
+        avg_comment_length = sum(map(len, comment_lines)) / max(len(comment_lines), 1) if comment_lines else 0
 
         ai_score = 0.0
         if comment_ratio > 0.3:
@@ -314,21 +796,15 @@ class AICodeDetector:
             'avg_comment_length': round(avg_comment_length, 2)
         }
 
-    def _analyze_code_structure(self, code: str) -> Dict[str, Any]:
-        lines = [l for l in code.split('\n') if l.strip()]
+    def _analyze_code_structure(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
+        view = view or CodeView(code)
+        lines = view.nonblank
 
-        indentation_levels = []
-        for line in lines:
-            if line.strip():
-                spaces = len(line) - len(line.lstrip())
-                indentation_levels.append(spaces)
+        # The most common indent-width-mod-4 bucket's share is the consistency score
+        indent_bins = view.indent_buckets
 
-        indent_consistency = 0.0
-        if indentation_levels:
-            indent_counter = Counter([i % 4 for i in indentation_levels if i > 0])
-            if indent_counter:
-                most_common = indent_counter.most_common(1)[0][1]
-                indent_consistency = most_common / len([i for i in indentation_levels if i > 0])
+        indented_count = sum(indent_bins)
+        indent_consistency = max(indent_bins) / indented_count if indented_count else 0.0
 
         blank_lines = code.count('\n\n')
         blank_line_ratio = blank_lines / max(len(lines), 1)
@@ -350,12 +826,13 @@ class AICodeDetector:
             'blank_line_ratio': round(blank_line_ratio, 3)
         }
 
-    def _analyze_complexity(self, code: str) -> Dict[str, Any]:
-        lines = [l.strip() for l in code.split('\n') if l.strip()]
+    def _analyze_complexity(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
+        view = view or CodeView(code)
 
-        avg_line_length = sum(len(l) for l in lines) / max(len(lines), 1)
+        # Blank lines strip to '', so they add nothing to the summed lengths
+        avg_line_length = sum(map(len, view.stripped)) / max(len(view.nonblank), 1)
 
-        control_structures = len(re.findall(r'\b(if|for|while|switch|case)\b', code))
+        control_structures = len(_RE_CONTROL_KEYWORD.findall(code))
         nesting_indicators = code.count('    if') + code.count('        if')
 
         ai_score = 0.0
@@ -376,12 +853,13 @@ class AICodeDetector:
             'nesting_indicators': nesting_indicators
         }
 
-    def _analyze_error_handling(self, code: str) -> Dict[str, Any]:
-        try_blocks = len(re.findall(r'\btry\s*:', code))
-        except_blocks = len(re.findall(r'\bexcept\s+', code))
-        null_checks = len(re.findall(r'(if\s+\w+\s+is\s+not\s+None|if\s+\w+\s*!=\s*null)', code, re.IGNORECASE))
+    def _analyze_error_handling(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
+        view = view or CodeView(code)
+        try_blocks = view.try_block_count
+        except_blocks = len(_RE_EXCEPT_CLAUSE.findall(code))
+        null_checks = len(_RE_ANY_NULL_CHECK.findall(code))
 
-        lines = [l for l in code.split('\n') if l.strip()]
+        lines = view.nonblank
         error_handling_ratio = (try_blocks + except_blocks + null_checks) / max(len(lines), 1)
 
         ai_score = 0.0
@@ -404,14 +882,14 @@ class AICodeDetector:
         }
 
     def _analyze_documentation(self, code: str) -> Dict[str, Any]:
-        docstrings = re.findall(r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'', code)
+        docstrings = _RE_DOCSTRING.findall(code)
 
-        function_defs = len(re.findall(r'\bdef\s+\w+\s*\(', code))
-        class_defs = len(re.findall(r'\bclass\s+\w+', code))
+        function_defs = len(_RE_FUNCTION_DEF.findall(code))
+        class_defs = len(_RE_CLASS_DEF.findall(code))
 
         documented_ratio = len(docstrings) / max(function_defs + class_defs, 1)
 
-        avg_docstring_length = sum(len(d) for d in docstrings) / max(len(docstrings), 1) if docstrings else 0
+        avg_docstring_length = sum(map(len, docstrings)) / max(len(docstrings), 1) if docstrings else 0
 
         ai_score = 0.0
         if documented_ratio > 0.7:
@@ -433,16 +911,9 @@ class AICodeDetector:
             'avg_docstring_length': round(avg_docstring_length, 2)
         }
 
-    def _analyze_formatting(self, code: str) -> Dict[str, Any]:
-        lines = [l for l in code.split('\n') if l.strip()]
-
-        spacing_patterns = []
-        for line in lines:
-            if '=' in line and 'def' not in line and 'class' not in line:
-                spacing_patterns.append('=' in line.replace('==', '').replace('!=', ''))
-
-        operator_spacing = len(re.findall(r'\s[+\-*/=]\s', code))
-        total_operators = len(re.findall(r'[+\-*/=]', code))
+    def _analyze_formatting(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
+        operator_spacing = (view or CodeView(code)).spaced_operator_count
+        total_operators = sum(map(code.count, '+-*/='))
         spacing_consistency = operator_spacing / max(total_operators, 1)
 
         ai_score = 0.0
@@ -462,15 +933,15 @@ class AICodeDetector:
         modern_features = 0
         legacy_features = 0
 
-        modern_features += len(re.findall(r':\s*(str|int|float|bool|List|Dict)', code))
-        modern_features += len(re.findall(r'\bf-["\']', code))
-        modern_features += len(re.findall(r'\bawait\s+', code))
-        modern_features += len(re.findall(r'\basync\s+def', code))
-        modern_features += len(re.findall(r'\bwith\s+\w+', code))
+        modern_features += len(_RE_BASIC_TYPE_HINT.findall(code))
+        modern_features += len(_RE_F_PREFIX.findall(code))
+        modern_features += len(_RE_AWAIT.findall(code))
+        modern_features += len(_RE_ASYNC_DEF.findall(code))
+        modern_features += len(_RE_WITH.findall(code))
 
-        legacy_features += len(re.findall(r'\bvar\s+', code))
-        legacy_features += len(re.findall(r'\.prototype\.', code))
-        legacy_features += len(re.findall(r'%\s*[sd]', code))
+        legacy_features += len(_RE_VAR_DECL.findall(code))
+        legacy_features += code.count('.prototype.')
+        legacy_features += len(_RE_PERCENT_FORMAT.findall(code))
 
         total_features = modern_features + legacy_features
         modern_ratio = modern_features / max(total_features, 1) if total_features > 0 else 0.5
@@ -486,32 +957,34 @@ class AICodeDetector:
 
     # ==================== NEW ENHANCED DIMENSIONS ====================
 
-    def _analyze_enhanced_comments(self, code: str) -> Dict[str, Any]:
+    def _analyze_enhanced_comments(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Enhanced comment analysis for AI-typical patterns."""
-        lines = code.split('\n')
-        comment_lines = [l.strip() for l in lines if l.strip().startswith('#') or l.strip().startswith('//')]
+        view = view or CodeView(code)
+        comment_lines = [view.stripped[i] for i in view.comment_indices]
 
+        # Only the first 10 matches of each kind are reported, so later ones
+        # are counted without building their display strings
         ai_phrases_found = []
         obvious_comments_found = []
+        ai_phrase_count = 0
+        obvious_comment_count = 0
 
-        # Check for AI-typical phrases
+        # Check each comment once for AI-typical phrases and obvious comments
         for comment in comment_lines:
-            comment_lower = comment.lower()
-            for phrase in self.ai_comment_phrases:
-                if re.search(phrase, comment_lower):
+            if self._ai_phrase_re.search(comment.lower()):
+                ai_phrase_count += 1
+                if ai_phrase_count <= 10:
                     ai_phrases_found.append(comment[:80])
-                    break
 
-        # Check for obvious comments
-        for comment in comment_lines:
-            for pattern, description in self.obvious_comment_patterns:
-                if re.search(pattern, comment, re.IGNORECASE):
+            description = self._match_obvious_comment(comment)
+            if description:
+                obvious_comment_count += 1
+                if obvious_comment_count <= 10:
                     obvious_comments_found.append(f"{description}: {comment[:60]}")
-                    break
 
         total_comments = len(comment_lines)
-        ai_phrase_ratio = len(ai_phrases_found) / max(total_comments, 1)
-        obvious_ratio = len(obvious_comments_found) / max(total_comments, 1)
+        ai_phrase_ratio = ai_phrase_count / max(total_comments, 1)
+        obvious_ratio = obvious_comment_count / max(total_comments, 1)
 
         ai_score = 0.0
         if ai_phrase_ratio > 0.3:
@@ -529,58 +1002,61 @@ class AICodeDetector:
         return {
             'scores': {
                 'ai_indicators': ai_score,
-                'ai_phrase_count': len(ai_phrases_found),
-                'obvious_comment_count': len(obvious_comments_found),
+                'ai_phrase_count': ai_phrase_count,
+                'obvious_comment_count': obvious_comment_count,
                 'total_comments': total_comments,
                 'ai_phrase_ratio': round(ai_phrase_ratio, 3),
                 'obvious_ratio': round(obvious_ratio, 3)
             },
-            'obvious_comments': obvious_comments_found[:10],
-            'ai_phrases': ai_phrases_found[:10]
+            'obvious_comments': obvious_comments_found,
+            'ai_phrases': ai_phrases_found
         }
 
-    def _analyze_defensive_coding(self, code: str) -> Dict[str, Any]:
+    def _analyze_defensive_coding(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Detect excessive defensive coding patterns typical of AI."""
+        view = view or CodeView(code)
         patterns_found = []
 
-        # Excessive null/None checks
-        none_checks = re.findall(r'if\s+\w+\s+is\s+not\s+None', code)
-        null_checks = re.findall(r'if\s+\w+\s*!=\s*null', code, re.IGNORECASE)
+        # Excessive null/None checks. The case-insensitive scan cannot use re's
+        # literal-prefix search, so it only runs when a '!= null' anchor exists.
+        none_checks = _RE_NONE_CHECK.findall(code)
+        null_checks = []
+        if _RE_NULL_ANCHOR.search(code):
+            null_checks = _RE_NULL_CHECK.findall(code)
         none_check_count = len(none_checks) + len(null_checks)
         if none_check_count > 0:
             patterns_found.extend([f"None check: {c[:50]}" for c in none_checks[:3]])
 
         # Redundant type checking
-        type_checks = re.findall(r'isinstance\s*\(\s*\w+\s*,\s*\w+\s*\)', code)
+        type_checks = _RE_ISINSTANCE.findall(code)
         type_check_count = len(type_checks)
         if type_check_count > 3:
             patterns_found.append(f"Excessive type checks: {type_check_count} isinstance calls")
 
-        # Over-use of try-catch
-        try_blocks = len(re.findall(r'\btry\s*:', code))
-        simple_operations = len(re.findall(r'try\s*:\s*\n\s*\w+\s*=', code))
+        # Over-use of try-catch (counted once per view, shared with the
+        # error-handling analyzer)
+        try_blocks = view.try_block_count
         if try_blocks > 3:
             patterns_found.append(f"Many try blocks: {try_blocks}")
 
         # Redundant assertions
-        assertions = re.findall(r'assert\s+.+', code)
+        assertions = _RE_ASSERT.findall(code)
         assert_count = len(assertions)
         if assert_count > 2:
             patterns_found.append(f"Multiple assertions: {assert_count}")
 
         # Multiple validation of same condition
-        if_conditions = re.findall(r'if\s+(.+?):', code)
+        if_conditions = _RE_IF_CONDITION.findall(code)
         condition_counter = Counter(if_conditions)
         repeated_conditions = sum(1 for c, count in condition_counter.items() if count > 1)
         if repeated_conditions > 0:
             patterns_found.append(f"Repeated conditions: {repeated_conditions}")
 
         # Input validation patterns
-        validation_patterns = len(re.findall(r'if\s+not\s+\w+\s*:', code))
-        validation_patterns += len(re.findall(r'if\s+\w+\s+is\s+None\s*:', code))
-        validation_patterns += len(re.findall(r'raise\s+(ValueError|TypeError|RuntimeError)', code))
+        validation_patterns = len(_RE_VALIDATION.findall(code))
+        validation_patterns += len(_RE_RAISE_VALIDATION.findall(code))
 
-        lines = [l for l in code.split('\n') if l.strip()]
+        lines = view.nonblank
         defensive_ratio = (none_check_count + type_check_count + try_blocks + validation_patterns) / max(len(lines), 1)
 
         ai_score = 0.0
@@ -609,38 +1085,44 @@ class AICodeDetector:
             'patterns': patterns_found[:10]
         }
 
-    def _analyze_textbook_algorithms(self, code: str) -> Dict[str, Any]:
+    def _analyze_textbook_algorithms(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Detect textbook/standard algorithm implementations."""
         patterns_found = []
         textbook_count = 0
 
         for pattern, description in self.textbook_patterns:
-            matches = re.findall(pattern, code)
+            matches = pattern.findall(code)
             if matches:
                 textbook_count += len(matches)
                 patterns_found.append(description)
 
+        # 'i = i + 1' needs a backreference, so it is counted by hand
+        self_increments = _count_self_increments(code)
+        if self_increments:
+            textbook_count += self_increments
+            patterns_found.append('i = i + 1 instead of i += 1')
+
         # Verbose solutions detection
         verbose_indicators = 0
 
         # range(len()) instead of enumerate
-        range_len = len(re.findall(r'range\s*\(\s*len\s*\(', code))
+        range_len = len(_RE_RANGE_LEN.findall(code))
         if range_len > 0:
             verbose_indicators += range_len
 
         # Manual string concatenation instead of join
-        string_concat = len(re.findall(r'\w+\s*\+=\s*["\']', code))
+        string_concat = _count_string_concats(code)
         if string_concat > 2:
             verbose_indicators += 1
             patterns_found.append("String concatenation in loop")
 
         # Manual list building instead of comprehension
-        append_in_loop = len(re.findall(r'for\s+.+:\s*\n\s+\w+\.append\(', code, re.MULTILINE))
+        append_in_loop = len(_RE_APPEND_IN_LOOP.findall(code))
         if append_in_loop > 2:
             verbose_indicators += append_in_loop
             patterns_found.append(f"Append in loop ({append_in_loop}x) instead of comprehension")
 
-        lines = len([l for l in code.split('\n') if l.strip()])
+        lines = len((view or CodeView(code)).nonblank)
         textbook_ratio = textbook_count / max(lines, 1)
 
         ai_score = 0.0
@@ -666,21 +1148,25 @@ class AICodeDetector:
             'patterns': list(set(patterns_found))[:10]
         }
 
-    def _analyze_over_modularization(self, code: str) -> Dict[str, Any]:
+    def _analyze_over_modularization(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Detect over-modularization patterns typical of AI."""
         # Find all function definitions (handles multi-line and type hints)
-        func_pattern = r'def\s+(\w+)\s*\('
-        func_matches = list(re.finditer(func_pattern, code))
+        func_matches = list(_RE_FUNCTION_NAME.finditer(code))
 
         small_functions = []
         function_sizes = []
 
-        lines = code.split('\n')
+        view = view or CodeView(code)
+        lines = view.lines
         func_start_lines = []
 
-        # Find line numbers for each function start
+        # Find line numbers for each function start; matches come in order, so
+        # only the newlines since the previous match need counting
+        line_num = 0
+        prev_start = 0
         for match in func_matches:
-            line_num = code[:match.start()].count('\n')
+            line_num += code.count('\n', prev_start, match.start())
+            prev_start = match.start()
             func_start_lines.append((match.group(1), line_num))
 
         for i, (func_name, start_line) in enumerate(func_start_lines):
@@ -690,10 +1176,8 @@ class AICodeDetector:
             else:
                 end_line = len(lines)
 
-            func_body_lines = lines[start_line:end_line]
             # Count non-empty, non-comment lines (excluding the def line itself)
-            func_lines = [l for l in func_body_lines[1:] if l.strip() and not l.strip().startswith('#') and not l.strip().startswith('"""') and not l.strip().startswith("'''")]
-            func_size = len(func_lines)
+            func_size = sum(1 for s in view.stripped[start_line + 1:end_line] if s and not s.startswith(('#', '"""', "'''")))
             function_sizes.append(func_size)
 
             if func_size < 5:
@@ -704,8 +1188,7 @@ class AICodeDetector:
         small_func_ratio = small_func_count / max(total_functions, 1)
 
         # Check for helper function naming patterns
-        helper_patterns = ['_helper', '_util', '_process', '_handle', '_validate', '_check', '_get', '_set', '_create']
-        helper_count = sum(1 for m in func_matches if any(p in m.group(1).lower() for p in helper_patterns))
+        helper_count = sum(1 for name, _ in func_start_lines if _RE_HELPER_NAME.search(name.lower()))
         helper_ratio = helper_count / max(total_functions, 1)
 
         # Check for similar function patterns (repetitive structure)
@@ -737,32 +1220,51 @@ class AICodeDetector:
             'small_functions': small_functions[:10]
         }
 
-    def _analyze_enhanced_consistency(self, code: str) -> Dict[str, Any]:
+    def _analyze_enhanced_consistency(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Detect perfect consistency that's unnatural for humans."""
-        lines = [l for l in code.split('\n') if l.strip()]
+        view = view or CodeView(code)
 
         # Check naming consistency
-        snake_case = len(re.findall(r'\b[a-z]+_[a-z]+\b', code))
-        camel_case = len(re.findall(r'\b[a-z]+[A-Z][a-z]+\b', code))
+        naming_matches = _RE_SNAKE_OR_CAMEL.findall('\n'.join(view.identifiers))
+        snake_case = naming_matches.count('_')
+        camel_case = len(naming_matches) - snake_case
         total_naming = snake_case + camel_case
         naming_consistency = max(snake_case, camel_case) / max(total_naming, 1) if total_naming > 5 else 0.5
 
         # Check spacing around operators
-        spaced_ops = len(re.findall(r'\s[=+\-*/]\s', code))
-        unspaced_ops = len(re.findall(r'[a-zA-Z0-9][=+\-*/][a-zA-Z0-9]', code))
+        spaced_ops = view.spaced_operator_count
+        unspaced_ops = len(_RE_UNSPACED_OP.findall(code))
         total_ops = spaced_ops + unspaced_ops
         spacing_consistency = spaced_ops / max(total_ops, 1) if total_ops > 3 else 0.5
 
         # Check comment style consistency
-        hash_comments = len(re.findall(r'^\s*#', code, re.MULTILINE))
-        slash_comments = len(re.findall(r'^\s*//', code, re.MULTILINE))
+        hash_comments = sum(1 for i in view.comment_indices if view.stripped[i][0] == '#')
+        slash_comments = len(view.comment_indices) - hash_comments
         total_comments = hash_comments + slash_comments
         comment_style_consistency = max(hash_comments, slash_comments) / max(total_comments, 1) if total_comments > 2 else 0.5
 
         # Check indentation consistency (4 spaces vs tabs vs 2 spaces)
-        indent_4 = len(re.findall(r'^\s{4}[^\s]', code, re.MULTILINE))
-        indent_2 = len(re.findall(r'^\s{2}[^\s]', code, re.MULTILINE))
-        indent_tab = len(re.findall(r'^\t[^\t]', code, re.MULTILINE))
+        # Lines opening with exactly 4 or 2 whitespace characters. As with a
+        # multiline ^\s{n}[^\s] scan, a whitespace-only line carries its width
+        # plus the newline into the next line; walking backwards tracks that.
+        indent_4 = indent_2 = 0
+        run = None  # whitespace run from the current line start; None if it reaches the end
+        for line, stripped in zip(reversed(view.lines), reversed(view.stripped)):
+            if stripped:
+                run = len(line) - len(line.lstrip())
+            elif run is not None:
+                run += len(line) + 1
+            if run == 4:
+                indent_4 += 1
+            elif run == 2:
+                indent_2 += 1
+
+        # Lines opening with a single tab followed by any other character
+        # (lines opening with a tab, minus those opening with two)
+        text = '\n' + code
+        indent_tab = text.count('\n\t') - text.count('\n\t\t')
+        if view.lines[-1] == '\t':
+            indent_tab -= 1
         total_indent = indent_4 + indent_2 + indent_tab
         indent_consistency = max(indent_4, indent_2, indent_tab) / max(total_indent, 1) if total_indent > 3 else 0.5
 
@@ -798,42 +1300,43 @@ class AICodeDetector:
             'perfect_consistency_count': perfect_count
         }
 
-    def _analyze_contextual_quirks(self, code: str) -> Dict[str, Any]:
+    def _analyze_contextual_quirks(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Detect absence of human contextual quirks."""
         missing_quirks = []
 
         # Check for absence of TODO, FIXME, HACK, NOTE, XXX
-        has_todo = bool(re.search(r'(#|//)\s*(TODO|FIXME|HACK|NOTE|XXX)', code, re.IGNORECASE))
+        has_todo = bool(_RE_TODO.search(code))
         if not has_todo:
             missing_quirks.append("No TODO/FIXME/HACK/NOTE/XXX comments")
 
         # Check for absence of temp variable names
-        has_temp_vars = bool(re.search(r'\b(tmp|temp|foo|bar|baz|xxx|yyy|zzz)\b', code))
+        has_temp_vars = bool(_RE_TEMP_VARS.search(code))
         if not has_temp_vars:
             missing_quirks.append("No temporary variable names (tmp, temp, foo, bar)")
 
         # Check for absence of debugging artifacts
-        has_debug = bool(re.search(r'(console\.log|print\s*\(|debugger|System\.out\.print)', code))
+        has_debug = any(literal in code for literal in _DEBUG_LITERALS) or bool(_RE_PRINT_CALL.search(code))
         if not has_debug:
             missing_quirks.append("No debugging statements (print, console.log)")
 
         # Check for absence of commented-out code
-        commented_code = re.findall(r'#\s*(if|for|while|def|class|return|import)\s', code)
-        commented_code += re.findall(r'//\s*(if|for|while|function|class|return|import)\s', code)
-        if not commented_code:
+        has_commented_code = bool(_RE_COMMENTED_PY.search(code) or _RE_COMMENTED_JS.search(code))
+        if not has_commented_code:
             missing_quirks.append("No commented-out code")
 
         # Check for absence of magic numbers with comments
-        magic_with_comment = re.findall(r'\d+\s*#', code)
-        if not magic_with_comment:
+        has_magic_with_comment = '#' in code and bool(_RE_MAGIC.search(code))
+        if not has_magic_with_comment:
             missing_quirks.append("No magic numbers with inline comments")
 
         # Check for presence of abbreviations
-        has_abbrevs = bool(re.search(r'\b(cfg|ctx|env|msg|req|res|db|api|btn|img|err|fmt)\b', code))
+        # Substring checks rule out most abbreviation-free files before the
+        # whole-word scan
+        has_abbrevs = any(abbrev in code for abbrev in _ABBREVIATIONS) and bool(_RE_ABBREV.search(code))
         if not has_abbrevs:
             missing_quirks.append("No common abbreviations (cfg, ctx, env, msg, etc.)")
 
-        lines = len([l for l in code.split('\n') if l.strip()])
+        lines = len((view or CodeView(code)).nonblank)
         quirk_checks = 6
         missing_count = len(missing_quirks)
 
@@ -858,41 +1361,37 @@ class AICodeDetector:
                 'has_todo_fixme': has_todo,
                 'has_temp_vars': has_temp_vars,
                 'has_debug_statements': has_debug,
-                'has_commented_code': bool(commented_code)
+                'has_commented_code': has_commented_code
             },
             'missing': missing_quirks
         }
 
-    def _analyze_formatting_perfection(self, code: str) -> Dict[str, Any]:
+    def _analyze_formatting_perfection(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Detect perfect formatting that's unnatural for humans."""
-        lines = code.split('\n')
-        non_empty_lines = [l for l in lines if l.strip()]
+        view = view or CodeView(code)
+        non_empty_lines = view.nonblank
 
         # Check indentation perfection (all 4-space aligned)
-        indented_lines = [l for l in non_empty_lines if len(l) - len(l.lstrip()) > 0]
-        perfect_indent = sum(1 for l in indented_lines if (len(l) - len(l.lstrip())) % 4 == 0)
-        indent_perfection = perfect_indent / max(len(indented_lines), 1)
+        indent_perfection = view.indent_buckets[0] / max(len(view.indents), 1)
 
         # Check line length consistency
         line_lengths = [len(l.rstrip()) for l in non_empty_lines]
         if line_lengths:
-            avg_length = sum(line_lengths) / len(line_lengths)
-            length_variance = sum((l - avg_length) ** 2 for l in line_lengths) / len(line_lengths)
-            length_std = length_variance ** 0.5
+            length_std = _int_variance(line_lengths) ** 0.5
             # Low std dev indicates very consistent line lengths
             length_consistency = 1.0 if length_std < 15 else (1.0 - min(length_std / 50, 1.0))
         else:
             length_consistency = 0.5
 
-        # Check for 100% consistent trailing whitespace (none)
-        trailing_space = sum(1 for l in lines if l.rstrip() != l and l.strip())
-        no_trailing_space = trailing_space == 0
+        # Check for 100% consistent trailing whitespace (none): stripping only
+        # shortens lines that end in whitespace, so compare total lengths
+        no_trailing_space = sum(line_lengths) == sum(map(len, non_empty_lines))
 
         # Check blank line patterns (consistent separation)
-        blank_lines = [i for i, l in enumerate(lines) if not l.strip()]
+        blank_lines = view.blank_indices
         if len(blank_lines) > 2:
-            blank_gaps = [blank_lines[i+1] - blank_lines[i] for i in range(len(blank_lines)-1)]
-            gap_variance = sum((g - sum(blank_gaps)/len(blank_gaps))**2 for g in blank_gaps) / len(blank_gaps) if blank_gaps else 0
+            blank_gaps = list(map(operator.sub, blank_lines[1:], blank_lines))
+            gap_variance = _int_variance(blank_gaps)
             blank_line_regularity = 1.0 if gap_variance < 5 else (1.0 - min(gap_variance / 20, 1.0))
         else:
             blank_line_regularity = 0.5
@@ -923,25 +1422,26 @@ class AICodeDetector:
             'perfection_count': perfection_count
         }
 
-    def _analyze_obvious_comments(self, code: str) -> Dict[str, Any]:
+    def _analyze_obvious_comments(self, code: str, view: Optional[CodeView] = None) -> Dict[str, Any]:
         """Specifically detect obvious/redundant comments."""
-        lines = code.split('\n')
+        view = view or CodeView(code)
         obvious_examples = []
         obvious_count = 0
-        total_comments = 0
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if stripped.startswith('#') or stripped.startswith('//'):
-                total_comments += 1
-                comment_text = stripped.lstrip('#').lstrip('/').strip().lower()
-
-                # Check for obvious patterns
-                for pattern, description in self.obvious_comment_patterns:
-                    if re.search(pattern, comment_text):
-                        obvious_count += 1
-                        obvious_examples.append(f"[Line {i+1}] {description}: {stripped[:70]}")
-                        break
+        total_comments = len(view.comment_indices)
+
+        for i in view.comment_indices:
+            stripped = view.stripped[i]
+            body = stripped.lstrip('#').lstrip('/')
+            # Every pattern needs a comment marker, so a body without one
+            # cannot match; skip it before stripping and lowercasing
+            if '#' not in body and '//' not in body:
+                continue
+
+            # Check for obvious patterns
+            description = self._match_obvious_comment(body.strip().lower())
+            if description:
+                obvious_count += 1
+                obvious_examples.append(f"[Line {i+1}] {description}: {stripped[:70]}")
 
         obvious_ratio = obvious_count / max(total_comments, 1)
 
@@ -967,6 +1467,21 @@ class AICodeDetector:
             'examples': obvious_examples[:15]
         }
 
+    def _match_obvious_comment(self, text: str) -> Optional[str]:
+        """Return the description of the first obvious-comment pattern found in ``text``."""
+        # Every pattern needs a '#' or '//' marker, which text already stripped
+        # of its leading marker rarely contains. Past that, the fused prefilter
+        # rejects most comments in one scan; only hits pay for the ordered
+        # lookup that decides which description applies.
+        if '#' not in text and '//' not in text:
+            return None
+        if not self._obvious_prefilter.search(text):
+            return None
+        for pattern, description in self.obvious_comment_patterns:
+            if pattern.search(text):
+                return description
+        return None
+
     def _calculate_confidence(self, scores: Dict[str, Dict]) -> str:
         score_values = []
         for s in scores.values():
@@ -976,13 +1491,17 @@ class AICodeDetector:
         if not score_values:
             return "LOW"
 
-        variance = sum((x - sum(score_values)/len(score_values))**2 for x in score_values) / len(score_values)
+        variance = _variance(score_values)
 
         # Count how many dimensions agree
         high_ai = sum(1 for s in score_values if s > 0.5)
         low_ai = sum(1 for s in score_values if s < 0.3)
         agreement = max(high_ai, low_ai) / len(score_values)
+        return self._confidence_level(variance, agreement)
 
+    @staticmethod
+    def _confidence_level(variance: float, agreement: float) -> str:
+        """Confidence for a score variance and agreement; higher variance or lower agreement never raise it."""
         if variance < 0.04 and agreement > 0.6:
             return "HIGH"
         elif variance < 0.08 and agreement > 0.5:
@@ -992,91 +1511,71 @@ class AICodeDetector:
         else:
             return "LOW"
 
-    def _determine_verdict(self, ai_score: float, confidence: str, scores: Dict[str, Dict]) -> str:
-        # Count strong AI indicators
-        strong_ai_indicators = 0
-        if scores.get('obvious_comments', {}).get('ai_indicators', 0) > 0.4:
-            strong_ai_indicators += 1
-        if scores.get('enhanced_comment_analysis', {}).get('ai_indicators', 0) > 0.4:
-            strong_ai_indicators += 1
-        if scores.get('perfect_consistency', {}).get('ai_indicators', 0) > 0.4:
-            strong_ai_indicators += 1
-        if scores.get('contextual_quirks', {}).get('ai_indicators', 0) > 0.4:
-            strong_ai_indicators += 1
-        if scores.get('formatting_perfection', {}).get('ai_indicators', 0) > 0.4:
-            strong_ai_indicators += 1
-        if scores.get('defensive_coding', {}).get('ai_indicators', 0) > 0.4:
-            strong_ai_indicators += 1
+    def _settled_confidence(self, known_scores: Dict[str, float]) -> Optional[str]:
+        """Confidence a full analysis would report, once the unknown scores can't change it or the verdict.
+
+        Every dimension missing from ``known_scores`` may still score anywhere
+        in [0, 1]. Returns None while the score band, the confidence or the
+        strong-indicator lift in _determine_verdict could still change.
+        """
+        weights = self.DIMENSION_WEIGHTS
+        total_weight = sum(weights.values())
+        known_sum = sum(score * weights[name] for name, score in known_scores.items())
+        unknown_weight = sum(weight for name, weight in weights.items() if name not in known_scores)
+        band = bisect_left(self.VERDICT_SCORE_THRESHOLDS, known_sum / total_weight)
+        if band != bisect_left(self.VERDICT_SCORE_THRESHOLDS, (known_sum + unknown_weight) / total_weight):
+            return None
+
+        # Known scores in the order _calculate_confidence sees them, so a
+        # complete set gives exactly its variance
+        values = [known_scores[name] for name in weights if name in known_scores]
+        unknown = len(weights) - len(values)
+        mean = sum(values) / len(values)
+        # Unknown scores at the known mean give the least variance; variance is
+        # convex in each score, so the greatest puts each one at 0 or 1
+        least_variance = _variance(values + [mean] * unknown)
+        greatest_variance = max(_variance(values + [1.0] * ones + [0.0] * (unknown - ones))
+                                for ones in range(unknown + 1))
+        agreeing = max(sum(1 for s in values if s > 0.5), sum(1 for s in values if s < 0.3))
+        worst = self._confidence_level(greatest_variance, agreeing / len(weights))
+        if worst != self._confidence_level(least_variance, (agreeing + unknown) / len(weights)):
+            return None
+        if worst == "LOW" or not 2 <= band <= 4:
+            return worst
+
+        # Settled only once the strong indicators still to come can't change the lift
+        strong = sum(1 for name in self.STRONG_INDICATOR_DIMENSIONS if known_scores.get(name, 0) > 0.4)
+        pending = sum(1 for name in self.STRONG_INDICATOR_DIMENSIONS if name not in known_scores)
+        if strong >= band or strong + pending < band:
+            return worst
+        return None
 
+    def _determine_verdict(self, ai_score: float, confidence: str, scores: Dict[str, Dict]) -> str:
         if confidence == "LOW":
             return "INCONCLUSIVE - Manual review recommended"
 
-        # Enhanced verdict logic
-        if ai_score > 0.70 or (ai_score > 0.55 and strong_ai_indicators >= 4):
-            return "HIGHLY LIKELY AI-GENERATED"
-        elif ai_score > 0.55 or (ai_score > 0.45 and strong_ai_indicators >= 3):
-            return "LIKELY AI-GENERATED"
-        elif ai_score > 0.45 or (ai_score > 0.35 and strong_ai_indicators >= 2):
-            return "POSSIBLY AI-ASSISTED"
-        elif ai_score > 0.30:
-            return "MIXED INDICATORS"
-        else:
-            return "LIKELY HUMAN-WRITTEN"
+        # Count strong AI indicators
+        strong_ai_indicators = sum(
+            1 for name in self.STRONG_INDICATOR_DIMENSIONS
+            if scores.get(name, {}).get('ai_indicators', 0) > 0.4
+        )
+
+        # Enhanced verdict logic: the score band picks the verdict, and from the
+        # 0.35 band up, at least as many strong indicators as the band number
+        # lift it one band
+        band = bisect_left(self.VERDICT_SCORE_THRESHOLDS, ai_score)
+        if 2 <= band <= min(strong_ai_indicators, 4):
+            band += 1
+        return self.VERDICTS[band]
 
     def _extract_key_indicators(self, scores: Dict[str, Dict], detected_patterns: Dict[str, List]) -> Dict[str, Any]:
         indicators = {}
 
-        # Original indicators
-        if scores['naming_analysis'].get('avg_identifier_length', 0) > 10:
-            indicators['verbose_naming'] = True
-
-        if scores['comment_analysis'].get('comment_ratio', 0) > 0.25:
-            indicators['high_documentation'] = True
-
-        if scores['structure_analysis'].get('indent_consistency', 0) > 0.9:
-            indicators['perfect_formatting'] = True
-
-        if scores['error_handling'].get('error_handling_ratio', 0) > 0.08:
-            indicators['comprehensive_error_handling'] = True
-
-        if scores['modern_syntax'].get('modern_ratio', 0) > 0.8:
-            indicators['modern_syntax_heavy'] = True
-
-        # New indicators
-        enhanced_comments = scores.get('enhanced_comment_analysis', {})
-        if enhanced_comments.get('ai_phrase_ratio', 0) > 0.2:
-            indicators['ai_typical_comment_phrases'] = True
-
-        if enhanced_comments.get('obvious_ratio', 0) > 0.15:
-            indicators['obvious_comments_detected'] = True
-
-        defensive = scores.get('defensive_coding', {})
-        if defensive.get('defensive_ratio', 0) > 0.1:
-            indicators['excessive_defensive_coding'] = True
-
-        textbook = scores.get('textbook_algorithms', {})
-        if textbook.get('textbook_pattern_count', 0) > 2:
-            indicators['textbook_implementations'] = True
-
-        modular = scores.get('over_modularization', {})
-        if modular.get('small_function_ratio', 0) > 0.4:
-            indicators['over_modularized'] = True
-
-        consistency = scores.get('perfect_consistency', {})
-        if consistency.get('perfect_consistency_count', 0) >= 2:
-            indicators['unnaturally_perfect_consistency'] = True
-
-        quirks = scores.get('contextual_quirks', {})
-        if quirks.get('missing_quirk_count', 0) >= 4:
-            indicators['lacks_human_quirks'] = True
-
-        formatting = scores.get('formatting_perfection', {})
-        if formatting.get('perfection_count', 0) >= 3:
-            indicators['flawless_formatting'] = True
-
-        obvious = scores.get('obvious_comments', {})
-        if obvious.get('obvious_ratio', 0) > 0.2:
-            indicators['explains_obvious_code'] = True
+        # Every threshold is positive, so a missing dimension or score never fires
+        for dimension, score, compare, threshold, name in self.INDICATOR_RULES:
+            dimension_scores = scores.get(dimension)
+            if dimension_scores and compare(dimension_scores.get(score, 0), threshold):
+                indicators[name] = True
 
         # Add examples of detected patterns
         if detected_patterns.get('obvious_comment_examples'):
@@ -1100,6 +1599,70 @@ class AICodeDetector:
         return indicators
 
 
+# Detector owned by each worker process of AICodeDetector.analyze_files
+_WORKER_DETECTOR: Optional[AICodeDetector] = None
+
+
+def _init_worker(detector_class: type, max_file_size: int, cache_dir: Optional[str]):
+    """Build the detector for this worker process."""
+    global _WORKER_DETECTOR  # pylint: disable=global-statement
+    # The parent process already pruned the disk cache when it was opened
+    _WORKER_DETECTOR = detector_class(max_file_size=max_file_size, cache_dir=cache_dir, prune_cache=False)
+
+
+def default_cache_dir() -> str:
+    """Per-user directory for cached results, honouring XDG_CACHE_HOME."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'ai_code_detector')
+
+
+def _analyze_isolated(detector: AICodeDetector, file_path: str,
+                      fast: bool) -> Union[DetectionResult, AnalysisError]:
+    """Analyze one file, turning an exception into an AnalysisError for that file."""
+    try:
+        return detector.analyze_file(file_path, fast)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return AnalysisError(file_path, str(e) or type(e).__name__)
+
+
+def _analyze_batch_in_worker(file_paths: List[str], fast: bool) -> List[Union[DetectionResult, AnalysisError]]:
+    """Analyze a batch of files with this worker's detector."""
+    return [_analyze_isolated(_WORKER_DETECTOR, path, fast) for path in file_paths]
+
+
+def find_code_files(directory: str, extensions: Tuple[str, ...]) -> List[Path]:
+    """Files under ``directory`` ending in any of ``extensions``, grouped by extension.
+
+    One os.walk pass replaces an rglob per extension; each group keeps the
+    walk order, as the per-extension globs did.
+    """
+    groups: Dict[str, List[Path]] = {ext: [] for ext in extensions}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            if name.endswith(extensions):
+                path = Path(root, name)
+                for ext in extensions:
+                    if name.endswith(ext):
+                        groups[ext].append(path)
+    return [path for ext in extensions for path in groups[ext]]
+
+
+def write_json_results(results: List[DetectionResult], output_path: str):
+    """Write results as an indented JSON array, encoding one result at a time."""
+    # Result fields hold only JSON types, so a shallow dict of them encodes
+    # exactly like asdict() without deep-copying the nested scores
+    names = [f.name for f in fields(DetectionResult)]
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        separator = '\n  '
+        for result in results:
+            # Encoded strings escape newlines, so this only indents structure
+            encoded = json.dumps({name: getattr(result, name) for name in names}, indent=2)
+            f.write(separator + encoded.replace('\n', '\n  '))
+            separator = ',\n  '
+        f.write('\n]' if separator != '\n  ' else ']')
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='AI Code Detector - Analyze code to detect AI generation patterns (Enhanced Version)',
@@ -1137,16 +1700,23 @@ Examples:
                        help='HTML output file path (default: analysis_report.html)')
     parser.add_argument('--max-size', type=int, default=1,
                        help='Maximum file size in MB (default: 1MB)')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                       help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--fast', action='store_true',
+                       help='Skip dimensions once they can no longer change the verdict or confidence')
+    parser.add_argument('--cache-dir', metavar='DIR',
+                       help='Directory for cached results (default: ~/.cache/ai_code_detector)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write cached results')
 
     args = parser.parse_args()
 
-    detector = AICodeDetector(max_file_size=args.max_size * 1024 * 1024)
+    cache_dir = None if args.no_cache else (args.cache_dir or default_cache_dir())
+    detector = AICodeDetector(max_file_size=args.max_size * 1024 * 1024, cache_dir=cache_dir)
     files_to_analyze = []
 
     if args.directory:
-        extensions = tuple(args.extensions.split(','))
-        for ext in extensions:
-            files_to_analyze.extend(Path(args.directory).rglob(f'*{ext}'))
+        files_to_analyze.extend(find_code_files(args.directory, tuple(args.extensions.split(','))))
 
     if args.files:
         files_to_analyze.extend([Path(f) for f in args.files])
@@ -1155,11 +1725,17 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
-    results = []
-    for file_path in files_to_analyze:
-        result = detector.analyze_file(str(file_path))
-        results.append(result)
+    results = detector.analyze_files([str(f) for f in files_to_analyze], workers=args.workers, fast=args.fast)
 
+    # Detailed output groups scores by category
+    original_dims = ['naming_analysis', 'comment_analysis', 'structure_analysis',
+                     'complexity_analysis', 'error_handling', 'documentation',
+                     'formatting_consistency', 'modern_syntax']
+    new_dims = ['enhanced_comment_analysis', 'defensive_coding', 'textbook_algorithms',
+                'over_modularization', 'perfect_consistency', 'contextual_quirks',
+                'formatting_perfection', 'obvious_comments']
+
+    for result in results:
         if args.format == 'summary':
             print(f"\n{'='*80}")
             print(f"File: {result.file_path}")
@@ -1171,15 +1747,16 @@ Examples:
             if result.indicators:
                 print(f"\n📊 Key Indicators:")
                 for key, value in result.indicators.items():
+                    label = key.replace('_', ' ').title()
                     if isinstance(value, list):
-                        print(f"  • {key.replace('_', ' ').title()}:")
+                        print(f"  • {label}:")
                         for item in value[:5]:
                             print(f"      - {item}")
                     elif isinstance(value, bool):
                         if value:
-                            print(f"  • {key.replace('_', ' ').title()}")
+                            print(f"  • {label}")
                     else:
-                        print(f"  • {key.replace('_', ' ').title()}: {value}")
+                        print(f"  • {label}: {value}")
         else:
             print(f"\n{'='*80}")
             print(f"DETAILED ANALYSIS: {result.file_path}")
@@ -1192,14 +1769,6 @@ Examples:
             print("📈 DIMENSION SCORES:")
             print(f"{'─'*80}")
 
-            # Group scores by category
-            original_dims = ['naming_analysis', 'comment_analysis', 'structure_analysis',
-                           'complexity_analysis', 'error_handling', 'documentation',
-                           'formatting_consistency', 'modern_syntax']
-            new_dims = ['enhanced_comment_analysis', 'defensive_coding', 'textbook_algorithms',
-                       'over_modularization', 'perfect_consistency', 'contextual_quirks',
-                       'formatting_perfection', 'obvious_comments']
-
             print("\n  📁 ORIGINAL DIMENSIONS:")
             for category in original_dims:
                 if category in result.detailed_scores:
@@ -1233,21 +1802,20 @@ Examples:
                 print("🎯 KEY INDICATORS:")
                 print(f"{'─'*80}")
                 for key, value in result.indicators.items():
+                    label = key.replace('_', ' ').title()
                     if isinstance(value, list):
-                        print(f"\n  {key.replace('_', ' ').title()}:")
+                        print(f"\n  {label}:")
                         for item in value[:5]:
                             print(f"    • {item}")
                     elif isinstance(value, bool):
                         if value:
-                            print(f"  ✓ {key.replace('_', ' ').title()}")
+                            print(f"  ✓ {label}")
                     else:
-                        print(f"  • {key.replace('_', ' ').title()}: {value}")
+                        print(f"  • {label}: {value}")
 
     # JSON output
     if args.output:
-        output_data = [asdict(r) for r in results]
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+        write_json_results(results, args.output)
         print(f"\n\nJSON results saved to: {args.output}")
 
     # HTML report generation
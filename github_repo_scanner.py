@@ -21,7 +21,7 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict
 
 # Import the existing detector and report generator
-from ai_code_detector import AICodeDetector, DetectionResult
+from ai_code_detector import AICodeDetector, AnalysisError, DetectionResult
 from report_generator import ReportGenerator
 
 
@@ -77,10 +77,12 @@ class GitHubRepoScanner:
         '.pytest_cache', '.mypy_cache', 'eggs', '.eggs',
     }
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, workers: Optional[int] = None):
         """Initialize the scanner with the AI code detector"""
         self.detector = AICodeDetector()
         self.verbose = verbose
+        # Worker processes for analysis (default: CPU count)
+        self.workers = workers
         self.temp_dir = None
 
     def _log(self, message: str, prefix: str = "INFO"):
@@ -221,14 +223,19 @@ class GitHubRepoScanner:
         results = []
         total = len(files)
 
-        for idx, file_path in enumerate(files, 1):
+        analyzed = self.detector.iter_analyze_files([str(f) for f in files], workers=self.workers,
+                                                    return_exceptions=True)
+        for idx, (file_path, result) in enumerate(zip(files, analyzed), 1):
             # Show progress
             if self.verbose and idx % 10 == 0:
                 progress = (idx / total) * 100
                 self._log(f"Progress: {idx}/{total} files ({progress:.1f}%)", "PROGRESS")
 
+            if isinstance(result, AnalysisError):
+                self._log(f"Error analyzing {file_path}: {result}", "ERROR")
+                continue
+
             try:
-                result = self.detector.analyze_file(str(file_path))
                 # Convert to relative path for cleaner output
                 rel_path = str(file_path.relative_to(repo_path))
                 result.file_path = rel_path
@@ -565,6 +572,8 @@ Examples:
     parser.add_argument('--json-only', action='store_true', help='Generate only JSON report')
     parser.add_argument('--html-only', action='store_true', help='Generate only HTML report')
     parser.add_argument('-q', '--quiet', action='store_true', help='Suppress progress output')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                       help='Number of worker processes (default: CPU count)')
 
     args = parser.parse_args()
 
@@ -579,7 +588,7 @@ Examples:
                      for ext in args.extensions.split(',')]
 
     # Create scanner
-    scanner = GitHubRepoScanner(verbose=not args.quiet)
+    scanner = GitHubRepoScanner(verbose=not args.quiet, workers=args.workers)
 
     try:
         # Perform analysis
@@ -4,6 +4,7 @@ Report Generator for AI Code Detection
 # pylint: disable=line-too-long, too-many-lines
 import json
 import html
+from bisect import bisect_right
 from datetime import datetime
 from dataclasses import asdict
 from typing import List, Any, Dict # pylint: disable=unused-import
@@ -591,35 +592,31 @@ class ReportGenerator:
         }
     """
 
+    # Probability bands: below the first threshold, then at or above each one
+    PROBABILITY_THRESHOLDS = (35, 55, 75)
+    PROBABILITY_BANDS = (
+        ('#28a745', 'green', 'Likely Human'),
+        ('#ffc107', 'yellow', 'Mixed Indicators'),
+        ('#fd7e14', 'orange', 'Possibly AI-Assisted'),
+        ('#dc3545', 'red', 'Likely AI-Generated'),
+    )
+
+    @staticmethod
+    def get_probability_band(prob):
+        """Return the (color, css class, label) band for a probability percentage."""
+        return ReportGenerator.PROBABILITY_BANDS[bisect_right(ReportGenerator.PROBABILITY_THRESHOLDS, prob)]
+
     @staticmethod
     def get_probability_color(prob): # pylint: disable=missing-function-docstring
-        if prob >= 75:
-            return '#dc3545'  # Red
-        if prob >= 55:
-            return '#fd7e14'  # Orange
-        if prob >= 35:
-            return '#ffc107'  # Yellow
-        return '#28a745'  # Green
+        return ReportGenerator.get_probability_band(prob)[0]
 
     @staticmethod
     def get_probability_class(prob): # pylint: disable=missing-function-docstring
-        if prob >= 75:
-            return 'red'
-        if prob >= 55:
-            return 'orange'
-        if prob >= 35:
-            return 'yellow'
-        return 'green'
+        return ReportGenerator.get_probability_band(prob)[1]
 
     @staticmethod
     def get_probability_label(prob): # pylint: disable=missing-function-docstring
-        if prob >= 75:
-            return 'Likely AI-Generated'
-        if prob >= 55:
-            return 'Possibly AI-Assisted'
-        if prob >= 35:
-            return 'Mixed Indicators'
-        return 'Likely Human'
+        return ReportGenerator.get_probability_band(prob)[2]
 
     @staticmethod
     def generate_json_report(data: Any, output_path: str):
@@ -639,61 +636,61 @@ class ReportGenerator:
         dist_percentages = {k: (v / total) * 100 for k, v in analysis.distribution.items()}
 
         # Generate top files HTML
-        top_files_html = ""
+        top_files_parts = []
         for i, file in enumerate(analysis.top_ai_files, 1):
             color = ReportGenerator.get_probability_color(file['ai_probability'])
-            top_files_html += f"""
+            top_files_parts.append(f"""
             <tr>
                 <td>{i}</td>
                 <td class="file-path">{html.escape(str(file['file']))}</td>
                 <td style="color: {color}; font-weight: bold;">{file['ai_probability']}%</td>
                 <td>{file['confidence']}</td>
                 <td style="color: {color};">{html.escape(str(file['verdict']))}</td>
-            </tr>"""
+            </tr>""")
+        top_files_html = ''.join(top_files_parts)
 
         # Generate high risk files HTML
-        high_risk_html = ""
         if analysis.high_risk_files:
-            for file in analysis.high_risk_files[:20]:  # Limit to 20
-                high_risk_html += f"""
+            high_risk_html = ''.join(f"""
                 <tr class="high-risk">
                     <td class="file-path">{html.escape(str(file['file']))}</td>
                     <td style="color: #dc3545; font-weight: bold;">{file['ai_probability']}%</td>
                     <td>{file['confidence']}</td>
                     <td style="color: #dc3545;">{html.escape(str(file['verdict']))}</td>
-                </tr>"""
+                </tr>""" for file in analysis.high_risk_files[:20])  # Limit to 20
         else:
             high_risk_html = '<tr><td colspan="4" style="text-align: center; color: #28a745;">No high-risk files detected!</td></tr>'
 
         # Generate language breakdown HTML
-        lang_html = ""
+        lang_parts = []
         max_files = max(analysis.language_breakdown.values()) if analysis.language_breakdown else 1
         for lang, count in analysis.language_breakdown.items():
             width = (count / max_files) * 100
-            lang_html += f"""
+            lang_parts.append(f"""
             <div class="lang-bar">
                 <span class="lang-name">{html.escape(str(lang))}</span>
                 <div class="bar-container">
                     <div class="bar" style="width: {width}%"></div>
                 </div>
                 <span class="lang-count">{count} files</span>
-            </div>"""
+            </div>""")
+        lang_html = ''.join(lang_parts)
 
         # Generate all files table
-        all_files_html = ""
+        all_files_parts = []
         sorted_results = sorted(analysis.file_results, key=lambda x: x['ai_probability'], reverse=True)
         for result in sorted_results:
             color = ReportGenerator.get_probability_color(result['ai_probability'])
-            all_files_html += f"""
+            all_files_parts.append(f"""
             <tr>
                 <td class="file-path">{html.escape(str(result['file_path']))}</td>
                 <td style="color: {color}; font-weight: bold;">{result['ai_probability']}%</td>
                 <td>{result['human_probability']}%</td>
                 <td>{result['confidence']}</td>
                 <td style="color: {color};">{html.escape(str(result['verdict']))}</td>
-            </tr>"""
+            </tr>""")
 
-        html_content = f"""<!DOCTYPE html>
+        html_head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -831,7 +828,8 @@ class ReportGenerator:
                         </tr>
                     </thead>
                     <tbody>
-                        {all_files_html if all_files_html else '<tr><td colspan="5" style="text-align:center">No files analyzed</td></tr>'}
+                        """
+        html_tail = f"""
                     </tbody>
                 </table>
             </div>
@@ -845,8 +843,11 @@ class ReportGenerator:
 </body>
 </html>"""
 
+        # Rows go to the file straight from their parts, as in generate_files_report
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(html_head)
+            f.writelines(all_files_parts or ['<tr><td colspan="5" style="text-align:center">No files analyzed</td></tr>'])
+            f.write(html_tail)
         print(f"HTML report saved to: {output_path}")
 
     @staticmethod
@@ -857,49 +858,58 @@ class ReportGenerator:
         total_files = len(valid_results)
         avg_ai_prob = sum(r.ai_probability for r in valid_results) / max(total_files, 1)
 
-        # Distribution
-        distribution = {
-            'likely_human': sum(1 for r in valid_results if r.ai_probability < 35),
-            'mixed': sum(1 for r in valid_results if 35 <= r.ai_probability < 55),
-            'possibly_ai': sum(1 for r in valid_results if 55 <= r.ai_probability < 75),
-            'likely_ai': sum(1 for r in valid_results if r.ai_probability >= 75),
-        }
+        # Distribution over the probability bands, counted in one pass
+        band_counts = [0] * len(ReportGenerator.PROBABILITY_BANDS)
+        for r in valid_results:
+            band_counts[bisect_right(ReportGenerator.PROBABILITY_THRESHOLDS, r.ai_probability)] += 1
+        distribution = dict(zip(('likely_human', 'mixed', 'possibly_ai', 'likely_ai'), band_counts))
 
         # Generate file cards HTML
-        file_cards_html = ""
+        file_cards_parts = []
         sorted_results = sorted(valid_results, key=lambda x: x.ai_probability, reverse=True)
 
+        # Dimension and pattern sections shown on every file card
+        dimension_names = {
+            'naming_analysis': ('Naming Patterns', '📝'),
+            'comment_analysis': ('Comment Style', '💬'),
+            'structure_analysis': ('Code Structure', '🏗️'),
+            'complexity_analysis': ('Complexity', '🧩'),
+            'error_handling': ('Error Handling', '🛡️'),
+            'documentation': ('Documentation', '📖'),
+            'formatting_consistency': ('Formatting', '✨'),
+            'modern_syntax': ('Modern Syntax', '🚀'),
+            'enhanced_comment_analysis': ('Enhanced Comments', '🔍'),
+            'defensive_coding': ('Defensive Coding', '🔒'),
+            'textbook_algorithms': ('Textbook Patterns', '📚'),
+            'over_modularization': ('Over-Modularization', '📦'),
+            'perfect_consistency': ('Perfect Consistency', '🎯'),
+            'contextual_quirks': ('Contextual Quirks', '👤'),
+            'formatting_perfection': ('Formatting Perfection', '💎'),
+            'obvious_comments': ('Obvious Comments', '🔔'),
+        }
+        pattern_categories = [
+            ('obvious_comment_examples', 'Obvious Comments', '💬'),
+            ('ai_phrases', 'AI-Typical Phrases', '🤖'),
+            ('textbook_patterns', 'Textbook Patterns', '📚'),
+            ('defensive_patterns', 'Defensive Coding', '🛡️'),
+            ('small_functions', 'Small Functions', '📦'),
+            ('missing_quirks', 'Missing Human Quirks', '👤'),
+        ]
+
         for idx, result in enumerate(sorted_results):
             color_class = ReportGenerator.get_probability_class(result.ai_probability)
+            detailed_scores = result.detailed_scores
+            detected_patterns = result.detected_patterns
 
             # Generate dimension scores HTML
-            dimension_html = ""
-            dimension_names = {
-                'naming_analysis': ('Naming Patterns', '📝'),
-                'comment_analysis': ('Comment Style', '💬'),
-                'structure_analysis': ('Code Structure', '🏗️'),
-                'complexity_analysis': ('Complexity', '🧩'),
-                'error_handling': ('Error Handling', '🛡️'),
-                'documentation': ('Documentation', '📖'),
-                'formatting_consistency': ('Formatting', '✨'),
-                'modern_syntax': ('Modern Syntax', '🚀'),
-                'enhanced_comment_analysis': ('Enhanced Comments', '🔍'),
-                'defensive_coding': ('Defensive Coding', '🔒'),
-                'textbook_algorithms': ('Textbook Patterns', '📚'),
-                'over_modularization': ('Over-Modularization', '📦'),
-                'perfect_consistency': ('Perfect Consistency', '🎯'),
-                'contextual_quirks': ('Contextual Quirks', '👤'),
-                'formatting_perfection': ('Formatting Perfection', '💎'),
-                'obvious_comments': ('Obvious Comments', '🔔'),
-            }
-
+            dimension_parts = []
             for dim_key, (dim_name, dim_icon) in dimension_names.items():
-                if dim_key in result.detailed_scores:
-                    score_data = result.detailed_scores[dim_key]
+                if dim_key in detailed_scores:
+                    score_data = detailed_scores[dim_key]
                     ai_indicator = score_data.get('ai_indicators', 0)
                     score_pct = ai_indicator * 100
                     score_color = ReportGenerator.get_probability_color(score_pct)
-                    dimension_html += f'''
+                    dimension_parts.append(f'''
                     <div class="dimension-item">
                         <span class="dim-icon">{dim_icon}</span>
                         <span class="dim-name">{dim_name}</span>
@@ -907,42 +917,36 @@ class ReportGenerator:
                             <div class="dim-bar" style="width: {score_pct}%; background: {score_color};"></div>
                         </div>
                         <span class="dim-score" style="color: {score_color};">{score_pct:.0f}%</span>
-                    </div>'''
+                    </div>''')
+            dimension_html = ''.join(dimension_parts)
 
             # Generate detected patterns HTML
-            patterns_html = ""
-            pattern_categories = [
-                ('obvious_comment_examples', 'Obvious Comments', '💬'),
-                ('ai_phrases', 'AI-Typical Phrases', '🤖'),
-                ('textbook_patterns', 'Textbook Patterns', '📚'),
-                ('defensive_patterns', 'Defensive Coding', '🛡️'),
-                ('small_functions', 'Small Functions', '📦'),
-                ('missing_quirks', 'Missing Human Quirks', '👤'),
-            ]
-
+            patterns_parts = []
             for pattern_key, pattern_name, pattern_icon in pattern_categories:
-                if pattern_key in result.detected_patterns and result.detected_patterns[pattern_key]:
-                    patterns = result.detected_patterns[pattern_key][:5]
-                    patterns_html += f'''
+                if detected_patterns.get(pattern_key):
+                    patterns = detected_patterns[pattern_key][:5]
+                    patterns_parts.append(f'''
                     <div class="pattern-category">
                         <h5>{pattern_icon} {html.escape(str(pattern_name))}</h5>
-                        <ul class="pattern-list">'''
+                        <ul class="pattern-list">''')
                     for p in patterns:
                         escaped_p = html.escape(str(p))
-                        patterns_html += f'<li>{escaped_p}</li>'
-                    patterns_html += '</ul></div>'
+                        patterns_parts.append(f'<li>{escaped_p}</li>')
+                    patterns_parts.append('</ul></div>')
+            patterns_html = ''.join(patterns_parts)
 
             # Generate indicators HTML
             indicators_html = ""
             boolean_indicators = {k: v for k, v in result.indicators.items() if isinstance(v, bool) and v}
             if boolean_indicators:
-                indicators_html = '<div class="indicators-list">'
+                indicators_parts = ['<div class="indicators-list">']
                 for key in boolean_indicators:
                     indicator_name = html.escape(key.replace('_', ' ').title())
-                    indicators_html += f'<span class="indicator-badge">{indicator_name}</span>'
-                indicators_html += '</div>'
+                    indicators_parts.append(f'<span class="indicator-badge">{indicator_name}</span>')
+                indicators_parts.append('</div>')
+                indicators_html = ''.join(indicators_parts)
 
-            file_cards_html += f'''
+            file_cards_parts.append(f'''
             <div class="file-card" id="file-{idx}">
                 <div class="file-header">
                     <div class="file-info">
@@ -971,10 +975,10 @@ class ReportGenerator:
                     {'<div class="details-section"><h4>🎯 Key Indicators</h4>' + indicators_html + '</div>' if indicators_html else ''}
                 </div>
 
-                <button class="toggle-details" onclick="toggleDetails({idx})">
+                <button class="toggle-details">
                     <span class="expand-icon">▼</span> Show Details
                 </button>
-            </div>'''
+            </div>''')
 
         # Summary row for multiple files
         summary_section = ""
@@ -1023,7 +1027,7 @@ class ReportGenerator:
                 </div>
             </section>'''
 
-        html_content = f'''<!DOCTYPE html>
+        html_head = f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -1046,7 +1050,8 @@ class ReportGenerator:
 
         <section class="files-section">
             <h2 style="color: #fff; margin-bottom: 20px;">📄 File Analysis Results</h2>
-            {file_cards_html if file_cards_html else '<p style="color: var(--text-secondary);">No files were analyzed.</p>'}
+            '''
+        html_tail = f'''
         </section>
 
         <footer>
@@ -1059,10 +1064,11 @@ class ReportGenerator:
     </div>
 
     <script>
-        function toggleDetails(idx) {{
-            const card = document.getElementById('file-' + idx);
-            const details = card.querySelector('.file-details');
-            const btn = card.querySelector('.toggle-details');
+        // One delegated listener serves every card's toggle button
+        document.addEventListener('click', (event) => {{
+            const btn = event.target.closest('.toggle-details');
+            if (!btn) return;
+            const details = btn.closest('.file-card').querySelector('.file-details');
 
             if (details.classList.contains('visible')) {{
                 details.classList.remove('visible');
@@ -1073,7 +1079,7 @@ class ReportGenerator:
                 btn.classList.add('expanded');
                 btn.innerHTML = '<span class="expand-icon">▼</span> Hide Details';
             }}
-        }}
+        }});
 
         // Expand all for printing
         window.onbeforeprint = function() {{
@@ -1083,8 +1089,12 @@ class ReportGenerator:
 </body>
 </html>'''
 
+        # The cards go to the file straight from their parts, so the report is
+        # never assembled into one string
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+            f.write(html_head)
+            f.writelines(file_cards_parts or ['<p style="color: var(--text-secondary);">No files were analyzed.</p>'])
+            f.write(html_tail)
         print(f"HTML report saved to: {output_path}")
 
     @staticmethod
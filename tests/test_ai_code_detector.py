@@ -3,8 +3,12 @@ Unit tests for AICodeDetector
 """
 import unittest
 import os
+import json
 import tempfile
-from ai_code_detector import AICodeDetector
+from dataclasses import asdict
+from unittest import mock
+from pathlib import Path
+from ai_code_detector import AICodeDetector, find_code_files, write_json_results
 
 class TestAICodeDetector(unittest.TestCase):
     """Test suite for AICodeDetector class"""
@@ -48,6 +52,136 @@ class TestAICodeDetector(unittest.TestCase):
         result2 = detector2.analyze_file(path)
         self.assertEqual(result2.confidence, "ERROR")
 
+    def test_identical_content_reuses_result(self):
+        """Test that files with the same content share one cached analysis"""
+        detector = AICodeDetector()
+        content = 'def add(a, b):\n    return a + b\n'
+        first = detector.analyze_file(self.create_file('first.py', content))
+        second = detector.analyze_file(self.create_file('second.py', content))
+        self.assertEqual(len(detector._result_cache), 1)  # pylint: disable=protected-access
+        self.assertEqual(first.ai_probability, second.ai_probability)
+        self.assertEqual(first.detailed_scores, second.detailed_scores)
+        self.assertTrue(second.file_path.endswith('second.py'))
+        self.assertTrue(first.file_path.endswith('first.py'))
+
+    def test_analyze_files_matches_sequential(self):
+        """Test that parallel batch analysis returns per-file results in order"""
+        detector = AICodeDetector()
+        paths = [
+            self.create_file('a.py', 'def add(a, b):\n    return a + b\n'),
+            self.create_file('b.py', '# Initialize the counter\ncount = 0\n'),
+            os.path.join(self.test_dir.name, 'missing.py'),
+        ]
+        parallel = detector.analyze_files(paths, workers=2)
+        sequential = [AICodeDetector().analyze_file(path) for path in paths]
+        self.assertEqual(parallel, sequential)
+
+    def test_fast_mode_keeps_verdict(self):
+        """Test that fast analysis agrees with full analysis and is not cached"""
+        content = 'def add(a, b):\n    # Return the result\n    return a + b\n'
+        path = self.create_file('fast.py', content)
+        detector = AICodeDetector()
+        fast = detector.analyze_file(path, fast=True)
+        self.assertEqual(len(detector._result_cache), 0)  # pylint: disable=protected-access
+        full = detector.analyze_file(path)
+        self.assertEqual(fast.verdict, full.verdict)
+        self.assertEqual(fast.confidence, full.confidence)
+        self.assertLessEqual(set(fast.detailed_scores), set(full.detailed_scores))
+        skipped = set(full.detailed_scores) - set(fast.detailed_scores)
+        self.assertTrue(skipped)
+        self.assertEqual(set(fast.indicators['skipped_dimensions']), skipped)
+        self.assertNotIn('skipped_dimensions', full.indicators)
+
+    def test_cached_result_is_not_shared(self):
+        """Test that mutating a returned result leaves later cache hits intact"""
+        content = 'def add(a, b):\n    # Return the result\n    return a + b\n'
+        detector = AICodeDetector()
+        first = detector.analyze_file(self.create_file('first.py', content))
+        expected = json.loads(json.dumps(first.detailed_scores))
+        first.detailed_scores.clear()
+
+        second = detector.analyze_file(self.create_file('second.py', content))
+        self.assertEqual(second.detailed_scores, expected)
+        second.detailed_scores['naming_analysis'].clear()
+        self.assertEqual(detector.analyze_file(self.create_file('third.py', content)).detailed_scores, expected)
+
+    def test_unchanged_file_is_not_reread(self):
+        """Test that a file with the same mtime and size skips reading"""
+        path = self.create_file('stat.py', 'def add(a, b):\n    return a + b\n')
+        detector = AICodeDetector()
+        first = detector.analyze_file(path)
+        with mock.patch('builtins.open', side_effect=AssertionError):
+            self.assertEqual(detector.analyze_file(path), first)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('# Initialize the counter\ncount = 0\n')
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10 ** 9))
+        self.assertNotEqual(detector.analyze_file(path), first)
+
+    def test_disk_cache_reused_across_detectors(self):
+        """Test that results cached on disk are served to a fresh detector"""
+        content = 'def add(a, b):\n    # Return the result\n    return a + b\n'
+        first = self.create_file('first.py', content)
+        second = self.create_file('second.py', content)
+        cache_dir = os.path.join(self.test_dir.name, 'cache')
+        expected = AICodeDetector(cache_dir=cache_dir).analyze_file(first)
+
+        detector = AICodeDetector(cache_dir=cache_dir)
+        with mock.patch.object(detector, '_analyze_code', side_effect=AssertionError):
+            cached = detector.analyze_file(second)
+        self.assertEqual(cached.file_path, second)
+        self.assertEqual(cached.ai_probability, expected.ai_probability)
+        self.assertEqual(cached.detailed_scores, expected.detailed_scores)
+
+    def test_disk_cache_prunes_stale_entries(self):
+        """Test that opening the cache drops old source namespaces and excess entries"""
+        cache_dir = os.path.join(self.test_dir.name, 'cache')
+        results_dir = os.path.join(cache_dir, AICodeDetector.DISK_CACHE_SUBDIR)
+        stale = os.path.join(results_dir, '0123456789abcdef')
+        unmarked = os.path.join(results_dir, 'fedcba9876543210')
+        foreign = os.path.join(cache_dir, 'deadbeefcafef00d')
+        for path in (stale, unmarked, foreign):
+            os.makedirs(path)
+            Path(path, 'data.txt').write_text('keep')
+        Path(stale, AICodeDetector.DISK_CACHE_MARKER).touch()
+        detector = AICodeDetector(cache_dir=cache_dir)
+        for i in range(3):
+            detector.analyze_file(self.create_file(f'f{i}.py', f'value = {i}\n'))
+
+        with mock.patch.object(AICodeDetector, 'DISK_CACHE_SIZE', 2):
+            detector = AICodeDetector(cache_dir=cache_dir)
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(os.path.join(unmarked, 'data.txt')))
+        self.assertTrue(os.path.exists(os.path.join(foreign, 'data.txt')))
+        entries = [name for name in os.listdir(detector._disk_cache)  # pylint: disable=protected-access
+                   if name.endswith('.json')]
+        self.assertEqual(len(entries), 2)
+
+    def test_write_json_results_matches_json_dump(self):
+        """Test that streamed JSON output is identical to a single json.dump"""
+        detector = AICodeDetector()
+        results = [
+            detector.analyze_file(self.create_file('a.py', 'def add(a, b):\n    return a + b\n')),
+            detector.analyze_file(self.create_file('b.py', '# "quoted"\ncount = 0\n')),
+        ]
+        output = os.path.join(self.test_dir.name, 'out.json')
+        for batch in ([], results):
+            write_json_results(batch, output)
+            with open(output, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), json.dumps([asdict(r) for r in batch], indent=2))
+
+    def test_find_code_files_groups_by_extension(self):
+        """Test that the directory walk groups files by extension and skips directories"""
+        os.makedirs(os.path.join(self.test_dir.name, 'pkg', 'module.py'))
+        self.create_file('main.py', '')
+        self.create_file(os.path.join('pkg', 'util.js'), '')
+        self.create_file(os.path.join('pkg', 'core.py'), '')
+        self.create_file('notes.txt', '')
+        found = find_code_files(self.test_dir.name, ('.js', '.py'))
+        root = Path(self.test_dir.name)
+        self.assertEqual(found[0], root / 'pkg' / 'util.js')
+        self.assertEqual(sorted(found[1:]), [root / 'main.py', root / 'pkg' / 'core.py'])
+
     def test_default_limit(self):
         """Test default limit (1MB)"""
         detector = AICodeDetector()
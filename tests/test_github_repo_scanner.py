@@ -7,6 +7,7 @@ import shutil
 import tempfile
 from pathlib import Path
 # pylint: disable=protected-access
+from ai_code_detector import AICodeDetector
 from github_repo_scanner import GitHubRepoScanner
 
 class TestBranchValidation(unittest.TestCase):
@@ -116,5 +117,52 @@ class TestSymlinkTraversal(unittest.TestCase):
         self.assertIn("real.py", filenames)
         self.assertIn("link.py", filenames)
 
+class TestParallelAnalysis(unittest.TestCase):
+    """Test suite for analyzing repository files in worker processes."""
+
+    def setUp(self):
+        self.repo_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.repo_dir)
+
+    def test_workers_match_sequential_results(self):
+        """Ensure parallel analysis keeps file order and relative paths."""
+        files = []
+        for name, content in [("a.py", "def add(a, b):\n    return a + b\n"),
+                              ("b.py", "# Initialize the counter\ncount = 0\n")]:
+            path = self.repo_dir / name
+            path.write_text(content)
+            files.append(path)
+
+        sequential = GitHubRepoScanner(verbose=False, workers=1)._analyze_files(files, str(self.repo_dir))
+        parallel = GitHubRepoScanner(verbose=False, workers=2)._analyze_files(files, str(self.repo_dir))
+
+        self.assertEqual([r.file_path for r in parallel], ["a.py", "b.py"])
+        self.assertEqual(parallel, sequential)
+
+    def test_failing_file_is_skipped(self):
+        """Ensure one file whose analysis raises does not abort the others."""
+        files = []
+        for name, content in [("a.py", "x = 1\n"), ("b.py", "BOOM = 1\n"), ("c.py", "y = 2\n")]:
+            path = self.repo_dir / name
+            path.write_text(content)
+            files.append(path)
+
+        for workers in (1, 2):
+            scanner = GitHubRepoScanner(verbose=False, workers=workers)
+            scanner.detector = FailingDetector()
+            results = scanner._analyze_files(files, str(self.repo_dir))
+            self.assertEqual([r.file_path for r in results], ["a.py", "c.py"])
+
+
+class FailingDetector(AICodeDetector):
+    """Detector whose analysis raises for code mentioning BOOM; module-level so workers can import it."""
+
+    def _analyze_documentation(self, code):
+        if "BOOM" in code:
+            raise RuntimeError("analysis failed")
+        return super()._analyze_documentation(code)
+
 if __name__ == '__main__':
     unittest.main()